@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional
+from hashlib import blake2b
+from typing import NamedTuple, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel
 
 from app.models import (
     GameLinesResponse,
@@ -14,35 +17,118 @@ from app.models import (
     RefreshResponse,
     Window,
 )
+from app.services.cache import InMemoryCache
 from app.services.matchup_service import MatchupService
 from app.utils import current_et_date
 
 router = APIRouter(prefix="/api", tags=["matchups"])
 
 
+class _EncodedBody(NamedTuple):
+    body: bytes
+    # Computed once when the body is encoded, so cache hits never re-hash it.
+    etag: str
+
+
+# Meta only changes when the ET date rolls over, so its encoded body is held per date.
+_META_CACHE: tuple[date, _EncodedBody] | None = None
+
+# Encoded response bodies are cached per route; matchups carry the live injury overlay so
+# they stay short-lived.
+_MATCHUPS_RESPONSE_TTL_SECONDS = 30
+_GAME_LINES_RESPONSE_TTL_SECONDS = 300
+# Diagnostics hit upstream providers on every call; a short TTL caps that to once per window.
+_DEBUG_RESPONSE_TTL_SECONDS = 15
+# Last successful bodies are kept much longer and served with X-Cache: stale when a live
+# computation fails, so upstream flaps degrade to slightly old data instead of a 500.
+_LAST_GOOD_TTL_SECONDS = 6 * 3600
+
+
 def get_matchup_service(request: Request) -> MatchupService:
     return request.app.state.matchup_service
 
 
+def _json_response(model: BaseModel) -> Response:
+    # Returning a Response directly skips FastAPI's jsonable_encoder pass, and model_dump_json
+    # serializes in a single pass in pydantic-core instead of building an intermediate dict.
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _encode_body(payload: BaseModel | dict) -> _EncodedBody:
+    if isinstance(payload, BaseModel):
+        body = payload.model_dump_json().encode()
+    else:
+        body = orjson.dumps(payload)
+    return _EncodedBody(body, f'"{blake2b(body, digest_size=16).hexdigest()}"')
+
+
+def _cached_body(cache: InMemoryCache, key: str) -> _EncodedBody | None:
+    return cache.get_typed(key, _EncodedBody)
+
+
+def _cache_response_body(
+    cache: InMemoryCache,
+    key: str,
+    payload: BaseModel | dict,
+    ttl_seconds: float,
+) -> _EncodedBody:
+    encoded = _encode_body(payload)
+    # Bodies are derived from models the services already cache and persist; keep them memory-only.
+    cache.set(key, encoded, ttl_seconds=ttl_seconds, persist=False)
+    return encoded
+
+
+def _remember_last_good(cache: InMemoryCache, key: str, encoded: _EncodedBody) -> None:
+    # Refreshed in memory on every success, but only written to SQLite when the body changes.
+    previous = _cached_body(cache, key)
+    changed = previous is None or previous.etag != encoded.etag
+    cache.set(key, encoded, ttl_seconds=_LAST_GOOD_TTL_SECONDS, persist=changed)
+
+
+def _bytes_response(request: Request, encoded: _EncodedBody, stale: bool = False) -> Response:
+    headers = {"ETag": encoded.etag}
+    if stale:
+        headers["X-Cache"] = "stale"
+    if request.headers.get("if-none-match") == encoded.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
 @router.get("/meta", response_model=MetaResponse)
-def get_meta(service: MatchupService = Depends(get_matchup_service)) -> MetaResponse:
-    return MetaResponse(**service.get_meta())
+async def get_meta(request: Request, service: MatchupService = Depends(get_matchup_service)) -> Response:
+    global _META_CACHE
+    today = current_et_date()
+    if _META_CACHE is None or _META_CACHE[0] != today:
+        meta = MetaResponse(**service.get_meta())
+        _META_CACHE = (today, _encode_body(meta))
+    return _bytes_response(request, _META_CACHE[1])
 
 
 @router.get("/matchups", response_model=MatchupResponse)
 async def get_matchups(
+    request: Request,
     service: MatchupService = Depends(get_matchup_service),
     date_param: Optional[date] = Query(default=None, alias="date"),
     window: Window = Query(default=Window.season),
-) -> MatchupResponse:
-    try:
-        target_date = date_param or current_et_date()
-        return await service.get_matchups(
-            slate_date=target_date,
-            window=window,
-        )
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to compute matchups: {exc}") from exc
+) -> Response:
+    target_date = date_param or current_et_date()
+    cache_key = f"resp:/matchups:{target_date.isoformat()}:{window.value}"
+    last_good_key = f"last_good:/matchups:{target_date.isoformat()}:{window.value}"
+    body = _cached_body(service.cache, cache_key)
+    if body is None:
+        try:
+            result = await service.cache.single_flight(
+                cache_key,
+                lambda: service.get_matchups(slate_date=target_date, window=window),
+            )
+        except Exception as exc:
+            stale_body = _cached_body(service.cache, last_good_key)
+            if stale_body is not None:
+                return _bytes_response(request, stale_body, stale=True)
+            raise HTTPException(status_code=500, detail=f"Failed to compute matchups: {exc}") from exc
+        body = _cache_response_body(service.cache, cache_key, result, _MATCHUPS_RESPONSE_TTL_SECONDS)
+        _remember_last_good(service.cache, last_good_key, body)
+    return _bytes_response(request, body)
 
 
 @router.post("/refresh", response_model=RefreshResponse)
@@ -50,60 +136,95 @@ async def refresh(
     service: MatchupService = Depends(get_matchup_service),
     date_param: date = Query(alias="date"),
     recompute: bool = Query(default=False),
-) -> RefreshResponse:
+) -> Response:
     try:
-        return await service.refresh(slate_date=date_param, recompute=recompute)
+        # Overlapping refreshes for the same date and mode share one run instead of each
+        # re-fetching upstream data.
+        result = await service.cache.single_flight(
+            f"refresh:{date_param.isoformat()}:{recompute}",
+            lambda: service.refresh(slate_date=date_param, recompute=recompute),
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to refresh: {exc}") from exc
+    service.cache.invalidate_prefix(f"resp:/matchups:{date_param.isoformat()}:")
+    return _json_response(result)
 
 
 @router.get("/player-card", response_model=PlayerCardResponse)
 async def get_player_card(
+    request: Request,
     service: MatchupService = Depends(get_matchup_service),
     player_id: int = Query(alias="player_id"),
     date_param: Optional[date] = Query(default=None, alias="date"),
     window: PlayerCardWindow = Query(default=PlayerCardWindow.season),
-) -> PlayerCardResponse:
+) -> Response:
+    last_good_key = f"last_good:/player-card:{player_id}:{date_param or 'latest'}:{window.value}"
     try:
         card = await service.get_player_card(player_id=player_id, slate_date=date_param, window=window)
     except Exception as exc:
+        stale_body = _cached_body(service.cache, last_good_key)
+        if stale_body is not None:
+            return _bytes_response(request, stale_body, stale=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch player card: {exc}") from exc
 
     if card is None:
         raise HTTPException(status_code=404, detail="Player card not found for selected date.")
-    return card
+    body = _encode_body(card)
+    _remember_last_good(service.cache, last_good_key, body)
+    return _bytes_response(request, body)
 
 
 @router.get("/game-lines", response_model=GameLinesResponse)
 async def get_game_lines(
+    request: Request,
     service: MatchupService = Depends(get_matchup_service),
     date_param: Optional[date] = Query(default=None, alias="date"),
-) -> GameLinesResponse:
-    try:
-        target_date = date_param or current_et_date()
-        return await service.get_game_lines(slate_date=target_date)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch game lines: {exc}") from exc
+) -> Response:
+    target_date = date_param or current_et_date()
+    cache_key = f"resp:/game-lines:{target_date.isoformat()}"
+    body = _cached_body(service.cache, cache_key)
+    if body is None:
+        try:
+            result = await service.cache.single_flight(
+                cache_key,
+                lambda: service.get_game_lines(slate_date=target_date),
+            )
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch game lines: {exc}") from exc
+        body = _cache_response_body(service.cache, cache_key, result, _GAME_LINES_RESPONSE_TTL_SECONDS)
+    return _bytes_response(request, body)
 
 
 @router.get("/game-lines-debug")
 async def get_game_lines_debug(
+    request: Request,
     service: MatchupService = Depends(get_matchup_service),
     limit: int = Query(default=15, ge=1, le=50),
-) -> dict:
-    try:
-        return await service.sports_mcp_service.fetch_event_diagnostics(limit=limit)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch game line diagnostics: {exc}") from exc
+) -> Response:
+    cache_key = f"resp:/game-lines-debug:{limit}"
+    body = _cached_body(service.cache, cache_key)
+    if body is None:
+        try:
+            result = await service.sports_mcp_service.fetch_event_diagnostics(limit=limit)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch game line diagnostics: {exc}") from exc
+        body = _cache_response_body(service.cache, cache_key, result, _DEBUG_RESPONSE_TTL_SECONDS)
+    return _bytes_response(request, body)
 
 
 @router.get("/injuries-debug")
 async def get_injuries_debug(
+    request: Request,
     service: MatchupService = Depends(get_matchup_service),
     date_param: Optional[date] = Query(default=None, alias="date"),
-) -> dict:
-    try:
-        target_date = date_param or current_et_date()
-        return await service.injury_service.fetch_injuries_debug(target_date)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch injury diagnostics: {exc}") from exc
+) -> Response:
+    target_date = date_param or current_et_date()
+    cache_key = f"resp:/injuries-debug:{target_date.isoformat()}"
+    body = _cached_body(service.cache, cache_key)
+    if body is None:
+        try:
+            result = await service.injury_service.fetch_injuries_debug(target_date)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Failed to fetch injury diagnostics: {exc}") from exc
+        body = _cache_response_body(service.cache, cache_key, result, _DEBUG_RESPONSE_TTL_SECONDS)
+    return _bytes_response(request, body)
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import os
 from pathlib import Path
 
+import pandas as pd
+
 from app.api import router
 from app.models import Window
 from app.core.config import get_settings
@@ -26,9 +30,16 @@ def _env_bool(name: str, default: bool) -> bool:
 
 
 def create_app() -> FastAPI:
+    # Copy-on-write makes the NBA log builders' column selections lazy, so only reassigned columns
+    # are materialized. The builders stay correct without it; this only saves the copies.
+    pd.set_option("mode.copy_on_write", True)
     settings = get_settings()
 
-    app = FastAPI(title=settings.api_title, version=settings.api_version)
+    app = FastAPI(
+        title=settings.api_title,
+        version=settings.api_version,
+        default_response_class=ORJSONResponse,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -37,6 +48,8 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Matchup and game-line bodies are large, repetitive JSON; small payloads like /meta skip it.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     nba_service = NBADataService(enable_roster_fetch=_env_bool("ENABLE_ROSTER_FETCH", True))
     injury_service = InjuryService()
@@ -52,7 +65,7 @@ def create_app() -> FastAPI:
         db_path=str(snapshot_db_path) if not database_url else None,
     )
     snapshot_store.initialize()
-    cache_path = Path(__file__).resolve().parents[1] / ".cache" / "app_cache.pkl"
+    cache_path = Path(__file__).resolve().parents[1] / ".cache" / "app_cache.db"
     cache = InMemoryCache(ttl_minutes=360, persist_path=str(cache_path))
     sports_mcp_service = SportsMCPService()
     odds_api_service = OddsAPIService()
@@ -83,6 +96,13 @@ def create_app() -> FastAPI:
                 # Startup warmup should not block app serving.
                 continue
 
+    @app.on_event("shutdown")
+    async def close_services() -> None:
+        await app.state.matchup_service.drain_background_writes()
+        await injury_service.aclose()
+        await odds_api_service.aclose()
+        cache.flush()
+
     @app.get("/health")
     def health() -> dict:
         return {"ok": True}
@@ -4,7 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Window(str, Enum):
@@ -58,6 +58,10 @@ class PlayerMatchup(BaseModel):
     environment_score: float
     stat_ranks: Dict[str, int] = Field(default_factory=dict)
     stat_tiers: Dict[str, MatchupTier] = Field(default_factory=dict)
+    # Upper-cased player_name (and team+name) keys used to match injury rows; filled once so overlays
+    # never recompute them.
+    _name_key: Optional[str] = PrivateAttr(default=None)
+    _team_name_key: Optional[str] = PrivateAttr(default=None)
 
 
 class MatchupResponse(BaseModel):
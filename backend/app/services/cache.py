@@ -1,88 +1,194 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from functools import partial
 from pathlib import Path
 import pickle
+import queue
+import sqlite3
 import threading
-from typing import Any, Dict
+import time
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+_SHARD_COUNT = 16
+
+_T = TypeVar("_T")
 
 
 @dataclass
 class CacheEntry:
     value: Any
-    expires_at: datetime
+    # time.monotonic() deadline; persisted rows store the equivalent wall-clock time instead.
+    expires_at: float
 
 
 class InMemoryCache:
-    def __init__(self, ttl_minutes: int = 20, persist_path: str | None = None) -> None:
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._store: Dict[str, CacheEntry] = {}
+    def __init__(
+        self,
+        ttl_minutes: int = 20,
+        persist_path: str | None = None,
+        flush_delay_seconds: float = 0.5,
+    ) -> None:
+        self._ttl_seconds = ttl_minutes * 60
+        # Keys are spread over independently locked shards so unrelated keys never contend.
+        self._shards: list[tuple[Dict[str, CacheEntry], threading.RLock]] = [
+            ({}, threading.RLock()) for _ in range(_SHARD_COUNT)
+        ]
         self._lock = threading.RLock()
         self._persist_path = Path(persist_path) if persist_path else None
+        # Writes only record the touched key and nudge a background writer thread, which coalesces
+        # them into one SQLite transaction per window that rewrites just the changed rows.
+        self._flush_delay_seconds = flush_delay_seconds
+        self._flush_lock = threading.Lock()
+        self._write_requests: queue.Queue[None] = queue.Queue(maxsize=1)
+        self._writer: threading.Thread | None = None
+        self._pending: Dict[str, CacheEntry | None] = {}
+        self._conn: sqlite3.Connection | None = None
+        # Concurrent misses for the same key await one shared computation instead of each running it.
+        self._inflight: Dict[str, asyncio.Future] = {}
         if self._persist_path:
+            self._conn = self._connect(self._persist_path)
             self._load_persisted()
 
     def get(self, key: str) -> Any | None:
-        with self._lock:
-            entry = self._store.get(key)
-            if not entry:
-                return None
-            expires_at = self._normalize_datetime(entry.expires_at)
-            if datetime.now(UTC) >= expires_at:
-                self._store.pop(key, None)
-                self._persist()
-                return None
+        store, lock = self._shard(key)
+        # dict.get is atomic under the GIL, so live hits never take the shard lock.
+        entry = store.get(key)
+        if not entry:
+            return None
+        if time.monotonic() < entry.expires_at:
             return entry.value
+        with lock:
+            if store.get(key) is entry:
+                # Reads never touch disk; expired rows are purged the next time the file is loaded.
+                store.pop(key, None)
+        return None
 
-    def set(self, key: str, value: Any) -> None:
-        with self._lock:
-            self._store[key] = CacheEntry(value=value, expires_at=datetime.now(UTC) + self._ttl)
-            self._persist()
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None, persist: bool = True) -> None:
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        store, lock = self._shard(key)
+        entry = CacheEntry(value=value, expires_at=time.monotonic() + ttl)
+        with lock:
+            store[key] = entry
+        # Derived values (e.g. encoded response bodies) can opt out of the SQLite write.
+        if persist:
+            self._persist({key: entry})
+
+    def get_typed(self, key: str, expected_type: type[_T]) -> _T | None:
+        value = self.get(key)
+        # Exact type check: cached values are never subclasses, and this avoids an MRO walk per hit.
+        return value if type(value) is expected_type else None
+
+    async def single_flight(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._drop_inflight, key))
+        # Shielded so one cancelled caller does not cancel the computation for everyone else.
+        return await asyncio.shield(task)
+
+    def _drop_inflight(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
 
     def invalidate_prefix(self, prefix: str) -> int:
-        with self._lock:
-            keys = [key for key in self._store if key.startswith(prefix)]
-            for key in keys:
-                self._store.pop(key, None)
-            if keys:
-                self._persist()
-            return len(keys)
+        removed: Dict[str, CacheEntry | None] = {}
+        for store, lock in self._shards:
+            with lock:
+                keys = [key for key in store if key.startswith(prefix)]
+                for key in keys:
+                    store.pop(key, None)
+                    removed[key] = None
+        if removed:
+            self._persist(removed)
+        return len(removed)
+
+    def _shard(self, key: str) -> tuple[Dict[str, CacheEntry], threading.RLock]:
+        return self._shards[hash(key) & (_SHARD_COUNT - 1)]
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection | None:
+        conn: sqlite3.Connection | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v BLOB NOT NULL, exp REAL NOT NULL)")
+            return conn
+        except (OSError, sqlite3.Error):
+            # An unreadable cache file disables persistence rather than startup.
+            if conn is not None:
+                conn.close()
+            return None
 
     def _load_persisted(self) -> None:
-        path = self._persist_path
-        if path is None or not path.exists():
+        conn = self._conn
+        if conn is None:
             return
+        now = time.time()
         try:
-            with path.open("rb") as handle:
-                loaded = pickle.load(handle)
-            if not isinstance(loaded, dict):
+            with self._flush_lock:
+                conn.execute("DELETE FROM cache WHERE exp <= ?", (now,))
+                rows = conn.execute("SELECT k, v, exp FROM cache").fetchall()
+        except sqlite3.Error:
+            return
+        for key, blob, expires_ts in rows:
+            try:
+                value = pickle.loads(blob)
+            except Exception:
+                # Rows that no longer unpickle (e.g. renamed models) are skipped.
+                continue
+            self._shard(key)[0][key] = CacheEntry(value=value, expires_at=time.monotonic() + (expires_ts - now))
+
+    def flush(self) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
                 return
-            now = datetime.now(UTC)
-            for key, entry in loaded.items():
-                if not isinstance(key, str) or not isinstance(entry, CacheEntry):
+            upserts = []
+            deletes = []
+            wall_offset = time.time() - time.monotonic()
+            for key, entry in pending.items():
+                if entry is None:
+                    deletes.append((key,))
+                    continue
+                try:
+                    upserts.append((key, pickle.dumps(entry.value), entry.expires_at + wall_offset))
+                except Exception:
                     continue
-                expires_at = self._normalize_datetime(entry.expires_at)
-                if expires_at > now:
-                    self._store[key] = entry
-        except Exception:
-            # Corrupt cache files are ignored.
-            self._store = {}
-
-    def _persist(self) -> None:
-        path = self._persist_path
-        if path is None:
+            try:
+                conn.execute("BEGIN")
+                conn.executemany("DELETE FROM cache WHERE k = ?", deletes)
+                conn.executemany("REPLACE INTO cache (k, v, exp) VALUES (?, ?, ?)", upserts)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                # Cache persistence failures should not break request flow.
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+
+    def _persist(self, changes: Dict[str, CacheEntry | None]) -> None:
+        if self._conn is None:
             return
+        with self._lock:
+            self._pending.update(changes)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="cache-writer", daemon=True)
+                self._writer.start()
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("wb") as handle:
-                pickle.dump(self._store, handle)
-        except Exception:
-            # Cache persistence failures should not break request flow.
-            return
+            self._write_requests.put_nowait(None)
+        except queue.Full:
+            # A flush is already pending and will pick this write up.
+            pass
 
-    @staticmethod
-    def _normalize_datetime(value: datetime) -> datetime:
-        if value.tzinfo is None:
-            return value.replace(tzinfo=UTC)
-        return value.astimezone(UTC)
+    def _writer_loop(self) -> None:
+        while True:
+            self._write_requests.get()
+            time.sleep(self._flush_delay_seconds)
+            self.flush()
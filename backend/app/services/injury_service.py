@@ -1,17 +1,64 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from itertools import groupby
 import os
 import re
+import string
+import sys
 from datetime import date, datetime
+from functools import lru_cache
 from time import monotonic
-from typing import Any, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
+import orjson
 
 from app.models import InjuryTag
 from app.services.odds_api_service import TEAM_NAME_BY_ABBR
 
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+# Drops ASCII punctuation and whitespace in one C-level pass instead of a regex substitution.
+_TEAM_NAME_STRIP = str.maketrans("", "", string.punctuation + string.whitespace)
+
+
+def _team_name_key(name: str) -> str:
+    return name.translate(_TEAM_NAME_STRIP).lower()
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_datetime(raw: str) -> datetime | None:
+    # Report rows repeat the same few timestamps; fromisoformat accepts a trailing Z on 3.11+.
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+# team+name -> status and name -> status lookups, both keyed by upper-cased values.
+InjuryIndex = tuple[Dict[str, str], Dict[str, str]]
+
+
+def injury_lookup_key(team: str, name_key: str) -> str:
+    # One flat string key hashes once and can be stored alongside a player, unlike a fresh tuple per lookup.
+    return f"{team}\x1f{name_key}"
+
+
+def build_injury_index(injuries: List[InjuryTag]) -> InjuryIndex:
+    by_team_name = {
+        injury_lookup_key(injury.team.upper(), injury.player_name.upper()): injury.status for injury in injuries
+    }
+    # Derived from the team-keyed map so names are upper-cased once per injury.
+    by_name = {key.partition("\x1f")[2]: status for key, status in by_team_name.items()}
+    return by_team_name, by_name
+
 
 class InjuryService:
     _STATUS_NORMALIZATION = {
@@ -26,50 +73,195 @@ class InjuryService:
         "GAME TIME DECISION": "GTD",
         "GTD": "GTD",
     }
-    _INJURY_ROW_KEYS = {
-        "playerName",
-        "player_name",
-        "player",
-        "name",
-        "status",
-        "injuryStatus",
-        "designation",
-        "teamAbbrev",
-        "team",
-        "teamCode",
-        "notes",
-        "description",
+    # One scan for the first status word in free text; word-anchored so e.g. "WITHOUT" is not OUT.
+    _STATUS_PATTERN = re.compile(r"\b(?:(GAME\b.*\bDECISION)|(OUT)\b|(DOUBT)|(QUESTION)|(PROB))")
+    _STATUS_BY_GROUP = ("", "GTD", "OUT", "DOUBTFUL", "QUESTIONABLE", "PROBABLE")
+    # Statuses like "OUT (ANKLE)" or "QUESTIONABLE - REST" resolve from their leading word without a scan;
+    # each entry is (required leading text, status) and agrees with what _STATUS_PATTERN would find.
+    _STATUS_BY_PREFIX = {
+        "OUT ": ("OUT ", "OUT"),
+        "OUT-": ("OUT-", "OUT"),
+        "OUT(": ("OUT(", "OUT"),
+        "DOUB": ("DOUBT", "DOUBTFUL"),
+        "QUES": ("QUESTION", "QUESTIONABLE"),
+        "PROB": ("PROB", "PROBABLE"),
     }
-
-    def __init__(self, timeout_seconds: float = 8.0, ttl_seconds: int = 300) -> None:
+    _RETRY_ATTEMPTS = 2
+    _RETRY_BACKOFF_SECONDS = 0.25
+    # Any of these keys marks a dict as a candidate injury row ("athlete" covers ESPN nodes).
+    _CANDIDATE_ROW_KEYS = frozenset(
+        {
+            "athlete",
+            "playerName",
+            "player_name",
+            "player",
+            "name",
+            "status",
+            "injuryStatus",
+            "designation",
+            "teamAbbrev",
+            "team",
+            "teamCode",
+            "notes",
+            "description",
+        }
+    )
+    _PLAYER_NAME_KEYS = ("playerName", "name", "player", "player_name")
+    _TEAM_KEYS = ("teamAbbrev", "team", "teamCode", "team_abbrev")
+    _STATUS_KEYS = ("status", "injuryStatus", "designation", "player_status")
+    _COMMENT_KEYS = ("description", "notes", "comment")
+    _UPDATED_AT_KEYS = ("lastUpdated", "updatedAt", "updated_at", "timestamp")
+    # Provider-specific key orders, looked up once per row in priority order.
+    _ODDS_API_TEAM_KEYS = ("title", "team", "name")
+    _ODDS_API_PLAYER_NAME_KEYS = ("player", "playerName", "name")
+    _ODDS_API_STATUS_KEYS = ("status", "designation", "injuryStatus")
+    _ODDS_API_COMMENT_KEYS = ("description", "comment", "details")
+    _ODDS_API_UPDATED_AT_KEYS = ("updatedAt", "lastUpdate")
+    _ESPN_ATHLETE_NAME_KEYS = ("displayName", "shortName", "fullName")
+    _ESPN_PLAYER_NAME_KEYS = ("playerName", "name")
+    _ESPN_TEAM_OBJECT_KEYS = ("abbreviation", "shortDisplayName", "displayName")
+    _ESPN_TEAM_KEYS = ("team", "teamAbbrev")
+    _ESPN_STATUS_OBJECT_KEYS = ("name", "type", "abbreviation")
+    _ESPN_STATUS_KEYS = ("status", "injuryStatus", "designation")
+    _ESPN_COMMENT_KEYS = ("detail", "description", "longComment", "shortComment")
+    _ESPN_UPDATED_AT_KEYS = ("date", "updated", "lastUpdated", "timestamp")
+
+    def __init__(
+        self,
+        timeout_seconds: float = 8.0,
+        ttl_seconds: int = 300,
+        deadline_seconds: float = 3.0,
+        negative_ttl_seconds: int = 30,
+        max_cached_dates: int = 128,
+    ) -> None:
         self._timeout = timeout_seconds
+        # Per-request budget on the shared client, sized so a stalled read, the backoff and the retry
+        # all fit inside the overall sweep deadline (about 1.4s each with the 3s default).
+        read_timeout = min(
+            timeout_seconds,
+            (deadline_seconds - self._RETRY_BACKOFF_SECONDS * (self._RETRY_ATTEMPTS - 1)) / self._RETRY_ATTEMPTS,
+        )
+        self._request_timeout = httpx.Timeout(read_timeout, connect=min(1.0, read_timeout))
         self._ttl_seconds = ttl_seconds
-        self._cache: dict[str, tuple[float, List[InjuryTag]]] = {}
-        self._team_abbr_by_name = {
-            re.sub(r"[^a-z0-9]+", "", name.lower()): abbr for abbr, name in TEAM_NAME_BY_ABBR.items()
-        }
+        # Overall budget for one provider sweep; past it, the last good list for the date is served.
+        self._deadline_seconds = deadline_seconds
+        # Empty sweeps are cached briefly so a date with no report does not re-hit every provider.
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._max_cached_dates = max_cached_dates
+        self._cache: OrderedDict[str, tuple[float, List[InjuryTag]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Lookups built from the cached list for each date, rebuilt only when that list is replaced.
+        self._indexes: dict[str, tuple[List[InjuryTag], InjuryIndex]] = {}
+        # One pooled client per service: keep-alive and HTTP/2 reuse the TLS session across polls.
+        # Connection failures are retried once by the transport itself, before any request is sent.
+        self._client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+            ),
+        )
+        self._static_providers = self._build_static_providers()
+        self._team_abbr_by_name = {_team_name_key(name): abbr for abbr, name in TEAM_NAME_BY_ABBR.items()}
+        self._team_abbr_intern = {abbr: abbr for abbr in TEAM_NAME_BY_ABBR}
 
     async def fetch_injuries(self, slate_date: date) -> List[InjuryTag]:
         cache_key = slate_date.isoformat()
         cached = self._cache.get(cache_key)
-        now = monotonic()
-        if cached and now - cached[0] < self._ttl_seconds:
+        if cached and monotonic() < cached[0]:
+            self._cache.move_to_end(cache_key)
             return cached[1]
 
-        providers = self._provider_urls(slate_date)
-        for source, url, headers in providers:
-            injuries, _ = await self._fetch_provider_injuries(source=source, url=url, headers=headers)
-            if not injuries:
-                continue
-            self._cache[cache_key] = (now, injuries)
-            return injuries
+        # Callers that miss while a sweep for the same date is running share its result.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._refresh_injuries(slate_date, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
 
+    async def fetch_injuries_indexed(self, slate_date: date) -> tuple[List[InjuryTag], InjuryIndex]:
+        injuries = await self.fetch_injuries(slate_date)
+        cache_key = slate_date.isoformat()
+        indexed = self._indexes.get(cache_key)
+        if indexed is None or indexed[0] is not injuries:
+            indexed = self._indexes[cache_key] = (injuries, build_injury_index(injuries))
+        return indexed
+
+    async def _refresh_injuries(self, slate_date: date, cache_key: str) -> List[InjuryTag]:
+        try:
+            injuries = await asyncio.wait_for(self._fetch_from_providers(slate_date), timeout=self._deadline_seconds)
+        except asyncio.TimeoutError:
+            cached = self._cache.get(cache_key)
+            if cached:
+                return cached[1]
+            raise
+        ttl = self._ttl_seconds if injuries else self._negative_ttl_seconds
+        self._cache[cache_key] = (monotonic() + ttl, injuries)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._max_cached_dates:
+            evicted_key, _ = self._cache.popitem(last=False)
+            self._indexes.pop(evicted_key, None)
+        return injuries
+
+    async def _fetch_from_providers(self, slate_date: date) -> List[InjuryTag]:
+        # Every provider is requested up front so fallbacks are already in flight when a
+        # higher-priority source comes back empty; results are still taken in priority order,
+        # and alternate URLs for the same source (e.g. dated and generic NBA CDN reports) race.
+        tasks = [
+            (source, asyncio.create_task(self._fetch_provider_injuries(source=source, url=url, headers=headers)))
+            for source, url, headers in self._provider_urls(slate_date)
+        ]
+        # Providers whose result is never awaited (a winner came back first, or the sweep was cancelled)
+        # have their exception retrieved explicitly rather than relying on cancel() of a finished task.
+        for _, task in tasks:
+            task.add_done_callback(self._discard_task_exception)
+        try:
+            for _, group in groupby(tasks, key=lambda item: item[0]):
+                injuries = await self._first_non_empty([task for _, task in group])
+                if injuries:
+                    return injuries
+            return []
+        finally:
+            for _, task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _discard_task_exception(task: asyncio.Task) -> None:
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _first_non_empty(tasks: list[asyncio.Task]) -> List[InjuryTag]:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task not in done:
+                    continue
+                injuries, _ = task.result()
+                if injuries:
+                    return injuries
         return []
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def fetch_injuries_debug(self, slate_date: date) -> dict[str, Any]:
         diagnostics: list[dict[str, Any]] = []
         for source, url, headers in self._provider_urls(slate_date):
-            injuries, detail = await self._fetch_provider_injuries(source=source, url=url, headers=headers)
+            try:
+                injuries, detail = await self._fetch_provider_injuries(
+                    source=source,
+                    url=url,
+                    headers=headers,
+                    want_debug=True,
+                )
+            except Exception as exc:
+                # The debug sweep reports every provider's failure, including parser errors that
+                # _fetch_provider_injuries lets propagate.
+                injuries, detail = [], {"status_code": None, "error": str(exc)}
             diagnostics.append(
                 {
                     "source": source,
@@ -112,68 +304,86 @@ class InjuryService:
         self,
         source: str,
         url: str,
-        headers: dict[str, str] | None,
+        headers: Mapping[str, str] | None,
+        want_debug: bool = False,
     ) -> tuple[List[InjuryTag], dict[str, Any]]:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url, headers=headers)
+            response = await self._get_with_retry(url, headers)
             status_code = response.status_code
             if status_code != 200:
                 return [], {"status_code": status_code, "error": None}
-            payload = response.json()
-            injuries = self._extract_injuries(payload=payload, source=source, default_team=None)
-            candidate_rows = len(self._collect_candidate_rows(payload)) if isinstance(payload, (dict, list)) else 0
+            payload = orjson.loads(response.content)
+            injuries, candidate_rows = self._extract_injuries(payload=payload, source=source, default_team=None)
+            if not want_debug:
+                return injuries, {"status_code": status_code, "error": None}
             return injuries, {
                 "status_code": status_code,
                 "error": None,
                 "payload_type": type(payload).__name__,
                 "candidate_rows": candidate_rows,
             }
-        except Exception as exc:
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as exc:
+            # Transport failures and undecodable bodies count as an empty provider; parsing bugs surface.
             return [], {"status_code": None, "error": str(exc)}
 
-    def _provider_urls(self, slate_date: date) -> list[tuple[str, str, dict[str, str] | None]]:
+    async def _get_with_retry(self, url: str, headers: Mapping[str, str] | None) -> httpx.Response:
+        # Connect failures are retried by the transport; this covers stalled reads. HTTP error
+        # statuses are returned as-is.
+        for attempt in range(1, self._RETRY_ATTEMPTS):
+            try:
+                return await self._client.get(url, headers=headers, timeout=self._request_timeout)
+            except httpx.ReadTimeout:
+                await asyncio.sleep(self._RETRY_BACKOFF_SECONDS * attempt)
+        return await self._client.get(url, headers=headers, timeout=self._request_timeout)
+
+    def _provider_urls(self, slate_date: date) -> list[tuple[str, str, Mapping[str, str] | None]]:
         date_token = slate_date.strftime("%Y%m%d")
-        browser_headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Referer": "https://www.nba.com/",
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
-            ),
-        }
-        urls: list[tuple[str, str, dict[str, str] | None]] = [
+        iso_date = slate_date.isoformat()
+        return [
+            (source, url.format(date=iso_date, date_token=date_token) if templated else url, headers)
+            for source, url, headers, templated in self._static_providers
+        ]
+
+    @staticmethod
+    def _build_static_providers() -> tuple[tuple[str, str, Mapping[str, str] | None, bool], ...]:
+        # Provider env vars and headers are fixed for the process; only the date is filled in per call.
+        browser_headers = MappingProxyType(
+            {
+                "Accept": "application/json, text/plain, */*",
+                "Referer": "https://www.nba.com/",
+                "User-Agent": _USER_AGENT,
+            }
+        )
+        providers: list[tuple[str, str, Mapping[str, str] | None, bool]] = [
             (
                 "espn",
                 "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/injuries",
-                {
-                    "Accept": "application/json, text/plain, */*",
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
-                    ),
-                },
+                MappingProxyType({"Accept": "application/json, text/plain, */*", "User-Agent": _USER_AGENT}),
+                False,
             ),
             (
                 "nba-cdn",
-                f"https://cdn.nba.com/static/json/liveData/injuryReport/injuryReport_{date_token}.json",
+                "https://cdn.nba.com/static/json/liveData/injuryReport/injuryReport_{date_token}.json",
                 browser_headers,
+                True,
             ),
             (
                 "nba-cdn",
                 "https://cdn.nba.com/static/json/liveData/injuryReport/injuryReport.json",
                 browser_headers,
+                False,
             ),
         ]
 
         odds_key = os.getenv("THE_ODDS_API_KEY", "").strip()
         odds_sport = os.getenv("THE_ODDS_SPORT", "basketball_nba").strip() or "basketball_nba"
         if odds_key:
-            urls.append(
+            providers.append(
                 (
                     "odds-api",
                     f"https://api.the-odds-api.com/v4/sports/{odds_sport}/injuries?apiKey={odds_key}",
                     None,
+                    False,
                 )
             )
 
@@ -181,17 +391,17 @@ class InjuryService:
         fallback_key = os.getenv("INJURY_FALLBACK_API_KEY", "").strip()
         fallback_key_header = os.getenv("INJURY_FALLBACK_API_KEY_HEADER", "x-api-key").strip() or "x-api-key"
         if fallback_url:
-            headers = {fallback_key_header: fallback_key} if fallback_key else None
-            urls.append(
-                (
-                    "injury-fallback",
-                    fallback_url.format(date=slate_date.isoformat(), date_token=date_token),
-                    headers,
-                )
-            )
-        return urls
+            headers = MappingProxyType({fallback_key_header: fallback_key}) if fallback_key else None
+            providers.append(("injury-fallback", fallback_url, headers, True))
+        return tuple(providers)
 
-    def _extract_injuries(self, payload: Any, source: str, default_team: str | None) -> List[InjuryTag]:
+    def _extract_injuries(
+        self,
+        payload: Any,
+        source: str,
+        default_team: str | None,
+    ) -> tuple[List[InjuryTag], int]:
+        # Also returns how many candidate rows were examined, so diagnostics need not re-walk the payload.
         if source == "odds-api":
             return self._extract_odds_api_injuries(payload)
         if source == "espn":
@@ -215,69 +425,59 @@ class InjuryService:
 
         injuries: List[InjuryTag] = []
         for row in rows:
-            player_name = str(
-                row.get("playerName")
-                or row.get("name")
-                or row.get("player")
-                or row.get("player_name")
-                or ""
-            ).strip()
-            raw_team = str(
-                row.get("teamAbbrev")
-                or row.get("team")
-                or row.get("teamCode")
-                or row.get("team_abbrev")
-                or ""
-            ).strip()
-            team = self._normalize_team(raw_team) or (default_team or "")
-            raw_status = str(
-                row.get("status")
-                or row.get("injuryStatus")
-                or row.get("designation")
-                or row.get("player_status")
-                or ""
-            ).strip().upper()
-            status = self._normalize_status(raw_status)
-            comment = str(
-                row.get("description")
-                or row.get("notes")
-                or row.get("comment")
-                or ""
-            ).strip() or None
-            updated_at = self._parse_updated_at(
-                row.get("lastUpdated")
-                or row.get("updatedAt")
-                or row.get("updated_at")
-                or row.get("timestamp")
-            )
-
+            player_name = self._first_str(row, self._PLAYER_NAME_KEYS)
+            if not player_name or player_name.upper().startswith("INJURY_STATUS_"):
+                continue
+            status = self._normalize_status(self._first_str(row, self._STATUS_KEYS, upper=True))
+            comment = self._first_str(row, self._COMMENT_KEYS) or None
             if not status and comment:
                 status = self._infer_status_from_text(comment)
+            if not status:
+                continue
 
-            if player_name and not player_name.upper().startswith("INJURY_STATUS_") and status:
-                injuries.append(
-                    InjuryTag(
-                        player_name=player_name,
-                        team=team or "UNK",
-                        status=status,
-                        comment=comment,
-                        source=source,
-                        updated_at=updated_at,
-                    )
+            team = self._normalize_team(self._first_str(row, self._TEAM_KEYS)) or (default_team or "")
+            updated_at = self._parse_updated_at(self._first_value(row, self._UPDATED_AT_KEYS))
+            # Fields are already normalized strings/datetimes, so skip pydantic validation per row.
+            injuries.append(
+                InjuryTag.model_construct(
+                    player_name=player_name,
+                    team=team or "UNK",
+                    status=status,
+                    comment=comment,
+                    source=source,
+                    updated_at=updated_at,
                 )
+            )
 
-        return injuries
+        return injuries, len(rows)
+
+    @staticmethod
+    def _first_str(row: dict[str, Any], keys: tuple[str, ...], upper: bool = False) -> str:
+        for key in keys:
+            value = row.get(key)
+            if value:
+                # Provider fields are almost always strings already; only coerce the odd number/bool.
+                text = (value if isinstance(value, str) else str(value)).strip()
+                return text.upper() if upper else text
+        return ""
 
-    def _extract_odds_api_injuries(self, payload: Any) -> List[InjuryTag]:
+    @staticmethod
+    def _first_value(row: dict[str, Any], keys: tuple[str, ...]) -> Any:
+        for key in keys:
+            value = row.get(key)
+            if value:
+                return value
+        return None
+
+    def _extract_odds_api_injuries(self, payload: Any) -> tuple[List[InjuryTag], int]:
         if not isinstance(payload, list):
-            return []
+            return [], 0
 
         injuries: List[InjuryTag] = []
         for team_item in payload:
             if not isinstance(team_item, dict):
                 continue
-            raw_team = str(team_item.get("title") or team_item.get("team") or team_item.get("name") or "").strip()
-            team = self._normalize_team(raw_team) or "UNK"
+            team = self._normalize_team(self._first_str(team_item, self._ODDS_API_TEAM_KEYS)) or "UNK"
             team_injuries = team_item.get("injuries")
             if not isinstance(team_injuries, list):
                 continue
@@ -285,35 +485,18 @@ class InjuryService:
             for injury_item in team_injuries:
                 if not isinstance(injury_item, dict):
                     continue
-                player_name = str(
-                    injury_item.get("player")
-                    or injury_item.get("playerName")
-                    or injury_item.get("name")
-                    or ""
-                ).strip()
-                raw_status = str(
-                    injury_item.get("status")
-                    or injury_item.get("designation")
-                    or injury_item.get("injuryStatus")
-                    or ""
-                ).strip().upper()
-                comment = str(
-                    injury_item.get("description")
-                    or injury_item.get("comment")
-                    or injury_item.get("details")
-                    or ""
-                ).strip() or None
+                player_name = self._first_str(injury_item, self._ODDS_API_PLAYER_NAME_KEYS)
+                raw_status = self._first_str(injury_item, self._ODDS_API_STATUS_KEYS, upper=True)
+                comment = self._first_str(injury_item, self._ODDS_API_COMMENT_KEYS) or None
                 status = self._normalize_status(raw_status)
                 if not status and comment:
                     status = self._infer_status_from_text(comment)
                 updated_at = self._parse_updated_at(
-                    injury_item.get("updatedAt")
-                    or injury_item.get("lastUpdate")
-                    or team_item.get("last_update")
+                    self._first_value(injury_item, self._ODDS_API_UPDATED_AT_KEYS) or team_item.get("last_update")
                 )
                 if player_name and status:
                     injuries.append(
-                        InjuryTag(
+                        InjuryTag.model_construct(
                             player_name=player_name,
                             team=team,
                             status=status,
@@ -322,107 +505,75 @@ class InjuryService:
                             updated_at=updated_at,
                         )
                     )
-        return injuries
+        return injuries, len(payload)
 
-    def _extract_espn_injuries(self, payload: Any) -> List[InjuryTag]:
+    def _extract_espn_injuries(self, payload: Any) -> tuple[List[InjuryTag], int]:
         nodes = self._collect_candidate_rows(payload, max_depth=8)
-        injuries: List[InjuryTag] = []
+        # Later rows for the same player replace earlier ones in place, matching the old post-pass.
+        deduped: dict[tuple[str, str], InjuryTag] = {}
 
         for node in nodes:
-            athlete = node.get("athlete") if isinstance(node, dict) else None
-            team_obj = node.get("team") if isinstance(node, dict) else None
-            status_obj = node.get("status") if isinstance(node, dict) else None
+            athlete = node.get("athlete")
+            team_obj = node.get("team")
+            status_obj = node.get("status")
 
             player_name = ""
             if isinstance(athlete, dict):
-                player_name = str(
-                    athlete.get("displayName")
-                    or athlete.get("shortName")
-                    or athlete.get("fullName")
-                    or ""
-                ).strip()
+                player_name = self._first_str(athlete, self._ESPN_ATHLETE_NAME_KEYS)
             if not player_name:
-                player_name = str(node.get("playerName") or node.get("name") or "").strip()
+                player_name = self._first_str(node, self._ESPN_PLAYER_NAME_KEYS)
 
             raw_team = ""
             if isinstance(team_obj, dict):
-                raw_team = str(
-                    team_obj.get("abbreviation")
-                    or team_obj.get("shortDisplayName")
-                    or team_obj.get("displayName")
-                    or ""
-                ).strip()
+                raw_team = self._first_str(team_obj, self._ESPN_TEAM_OBJECT_KEYS)
             if not raw_team:
-                raw_team = str(node.get("team") or node.get("teamAbbrev") or "").strip()
+                raw_team = self._first_str(node, self._ESPN_TEAM_KEYS)
             team = self._normalize_team(raw_team) or "UNK"
 
             raw_status = ""
             if isinstance(status_obj, dict):
-                raw_status = str(
-                    status_obj.get("name")
-                    or status_obj.get("type")
-                    or status_obj.get("abbreviation")
-                    or ""
-                ).strip().upper()
+                raw_status = self._first_str(status_obj, self._ESPN_STATUS_OBJECT_KEYS, upper=True)
             if not raw_status:
-                raw_status = str(
-                    node.get("status")
-                    or node.get("injuryStatus")
-                    or node.get("designation")
-                    or ""
-                ).strip().upper()
+                raw_status = self._first_str(node, self._ESPN_STATUS_KEYS, upper=True)
             status = self._normalize_status(raw_status)
 
-            comment = str(
-                node.get("detail")
-                or node.get("description")
-                or node.get("longComment")
-                or node.get("shortComment")
-                or ""
-            ).strip() or None
+            comment = self._first_str(node, self._ESPN_COMMENT_KEYS) or None
             if not status and comment:
                 status = self._infer_status_from_text(comment)
 
-            updated_at = self._parse_updated_at(
-                node.get("date")
-                or node.get("updated")
-                or node.get("lastUpdated")
-                or node.get("timestamp")
-            )
+            updated_at = self._parse_updated_at(self._first_value(node, self._ESPN_UPDATED_AT_KEYS))
 
             if player_name and status:
-                injuries.append(
-                    InjuryTag(
-                        player_name=player_name,
-                        team=team,
-                        status=status,
-                        comment=comment,
-                        source="espn",
-                        updated_at=updated_at,
-                    )
+                deduped[(team, player_name.upper())] = InjuryTag.model_construct(
+                    player_name=player_name,
+                    team=team,
+                    status=status,
+                    comment=comment,
+                    source="espn",
+                    updated_at=updated_at,
                 )
 
-        deduped: dict[tuple[str, str], InjuryTag] = {}
-        for injury in injuries:
-            deduped[(injury.team, injury.player_name.upper())] = injury
-        return list(deduped.values())
-
-    def _collect_candidate_rows(self, payload: Any, depth: int = 0, max_depth: int = 6) -> List[dict[str, Any]]:
-        if depth > max_depth:
-            return []
+        return list(deduped.values()), len(nodes)
 
+    def _collect_candidate_rows(self, payload: Any, max_depth: int = 6) -> List[dict[str, Any]]:
+        # Explicit stack instead of recursion; children are pushed reversed to keep pre-order output.
         out: List[dict[str, Any]] = []
-        if isinstance(payload, dict):
-            keys = set(payload.keys())
-            if keys.intersection(self._INJURY_ROW_KEYS) or "athlete" in keys or "status" in keys:
-                out.append(payload)
-            for value in payload.values():
-                out.extend(self._collect_candidate_rows(value, depth=depth + 1, max_depth=max_depth))
-            return out
-
-        if isinstance(payload, list):
-            for item in payload:
-                out.extend(self._collect_candidate_rows(item, depth=depth + 1, max_depth=max_depth))
+        row_keys = self._CANDIDATE_ROW_KEYS
+        stack: list[tuple[Any, int]] = [(payload, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                continue
+            if isinstance(node, dict):
+                if not row_keys.isdisjoint(node):
+                    out.append(node)
+                children = node.values()
+            elif isinstance(node, list):
+                children = node
+            else:
+                continue
+            child_depth = depth + 1
+            stack.extend((child, child_depth) for child in reversed(children))
         return out
 
     def _normalize_status(self, raw_status: str) -> str:
@@ -431,38 +582,25 @@ class InjuryService:
         normalized = self._STATUS_NORMALIZATION.get(raw_status)
         if normalized:
             return normalized
-        if "GAME" in raw_status and "DECISION" in raw_status:
-            return "GTD"
-        if "OUT" in raw_status:
-            return "OUT"
-        if "DOUBT" in raw_status:
-            return "DOUBTFUL"
-        if "QUESTION" in raw_status:
-            return "QUESTIONABLE"
-        if "PROB" in raw_status:
-            return "PROBABLE"
-        return raw_status
+        prefixed = self._STATUS_BY_PREFIX.get(raw_status[:4])
+        if prefixed and raw_status.startswith(prefixed[0]):
+            return prefixed[1]
+        match = self._STATUS_PATTERN.search(raw_status)
+        return self._STATUS_BY_GROUP[match.lastindex] if match else sys.intern(raw_status)
 
     def _normalize_team(self, value: str) -> str:
         candidate = value.strip().upper()
-        if len(candidate) in (2, 3, 4) and candidate.isalpha():
-            return candidate
-        normalized = re.sub(r"[^a-z0-9]+", "", value.lower())
+        if 2 <= len(candidate) <= 4 and candidate.isascii() and candidate.isalpha():
+            # Known abbreviations resolve to one shared string instead of a fresh copy per row.
+            return self._team_abbr_intern.get(candidate, candidate)
+        normalized = _team_name_key(value)
         if not normalized:
             return ""
         return self._team_abbr_by_name.get(normalized, "")
 
     def _infer_status_from_text(self, text: str) -> str:
-        raw = text.strip().upper()
-        if "OUT" in raw:
-            return "OUT"
-        if "DOUBT" in raw:
-            return "DOUBTFUL"
-        if "QUESTION" in raw:
-            return "QUESTIONABLE"
-        if "PROB" in raw:
-            return "PROBABLE"
-        return ""
+        match = self._STATUS_PATTERN.search(text.upper())
+        return self._STATUS_BY_GROUP[match.lastindex] if match else ""
 
     @staticmethod
     def _parse_updated_at(value: Any) -> datetime | None:
@@ -473,8 +611,4 @@ class InjuryService:
         raw = str(value).strip()
         if not raw:
             return None
-        try:
-            # Support trailing Z and plain ISO timestamps.
-            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        except Exception:
-            return None
+        return _parse_iso_datetime(raw)
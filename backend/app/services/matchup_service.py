@@ -1,36 +1,106 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date
+from functools import lru_cache
 import logging
+from operator import itemgetter
 from time import perf_counter
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
 
 from app.models import (
     GameLinesResponse,
     MatchupResponse,
+    MatchupTier,
     PlayerCardWindow,
     PlayerCardResponse,
     PlayerMatchup,
+    PositionGroup,
     RefreshResponse,
     Window,
 )
 from app.services.cache import InMemoryCache
-from app.services.injury_service import InjuryService
+from app.services.injury_service import InjuryIndex, InjuryService, build_injury_index, injury_lookup_key
 from app.services.nba_client import NBADataService
 from app.services.odds_api_service import OddsAPIService
 from app.services.snapshot_store import SnapshotStore
 from app.services.sports_mcp_service import SportsMCPService
 from app.utils import (
-    DISPLAY_STATS,
-    SUPPORTED_STATS,
+    DISPLAY_STAT_PAIRS,
+    TIERS_BY_RANK,
     as_of_date_for_slate,
     current_et_date,
     season_bounds_for_label,
     season_label_for_date,
-    to_tier,
 )
 
 
+class _Timer:
+    __slots__ = ("started", "stopped")
+
+    def __init__(self) -> None:
+        self.started = perf_counter()
+        self.stopped: float | None = None
+
+    def __enter__(self) -> _Timer:
+        self.started = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stopped = perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.stopped if self.stopped is not None else perf_counter()) - self.started
+
+
+@lru_cache(maxsize=64)
+def _upper_team(team: str) -> str:
+    return team.upper()
+
+
+def _player_lookup_keys(player: PlayerMatchup) -> tuple[str, str]:
+    name_key = player._name_key
+    if name_key is None:
+        name_key = player._name_key = player.player_name.upper()
+    team_name_key = player._team_name_key
+    if team_name_key is None:
+        team_name_key = player._team_name_key = injury_lookup_key(_upper_team(player.team), name_key)
+    return team_name_key, name_key
+
+
+_MAX_CACHED_OVERLAYS = 64
+# Each entry pins a full snapshot, so only the last few slates/windows keep their indexes.
+_MAX_SNAPSHOT_INDEXES = 4
+
+
+@lru_cache(maxsize=1024)
+def _matchups_key(slate_date: date, window_value: str) -> str:
+    return f"matchups:{slate_date.isoformat()}:{window_value}"
+
+
+@lru_cache(maxsize=1024)
+def _snapshot_key(season: str, as_of_date: date, team_token: str) -> str:
+    return f"snapshot:{season}:{as_of_date.isoformat()}:{team_token}"
+
+
+@lru_cache(maxsize=64)
+def _slate_layout(matchups: tuple[tuple[str, str], ...]) -> tuple[frozenset[str], str, Mapping[str, str]]:
+    # Shared by every computation over the same set of games: slate teams, snapshot key token, opponents.
+    opponent_map: Dict[str, str] = {}
+    for away_team, home_team in matchups:
+        opponent_map[away_team] = home_team
+        opponent_map[home_team] = away_team
+    slate_teams = frozenset(opponent_map)
+    team_token = ",".join(sorted(slate_teams)) if slate_teams else "none"
+    return slate_teams, team_token, MappingProxyType(opponent_map)
+
+
+def _slate_layout_for_games(games: List) -> tuple[frozenset[str], str, Mapping[str, str]]:
+    return _slate_layout(tuple((game.away_team, game.home_team) for game in games))
+
+
 class MatchupService:
     def __init__(
         self,
@@ -48,14 +118,51 @@ class MatchupService:
         self.snapshot_store = snapshot_store
         self.sports_mcp_service = sports_mcp_service or SportsMCPService()
         self.odds_api_service = odds_api_service or OddsAPIService()
+        self._background_writes: set[asyncio.Task] = set()
+        # Last overlaid response per base key, reused while both the base response and the injury
+        # list are the same cached objects.
+        self._overlays: Dict[str, tuple[MatchupResponse, List, MatchupResponse]] = {}
+        # Lookups derived from a cached snapshot (flattened ranks per window, rotation pool by team), reused
+        # while the cache still hands back the same snapshot object. They live here rather than inside the
+        # snapshot: cached values may still be queued for pickling on the cache writer thread, and derived
+        # indexes should not be persisted.
+        self._snapshot_indexes: Dict[str, tuple[Dict[str, Any], Dict[str, Any]]] = {}
 
     async def get_matchups(
         self,
         slate_date: date,
         window: Window,
     ) -> MatchupResponse:
-        window_key = window.value
-        base_cache_key = f"matchups:{slate_date.isoformat()}:{window_key}"
+        base_cache_key = _matchups_key(slate_date, window.value)
+        base_response = self.cache.get(base_cache_key)
+        if base_response is None or base_response.as_of_date < as_of_date_for_slate(slate_date):
+            # Concurrent misses for the same slate share one store lookup / recompute.
+            base_response = await self.cache.single_flight(
+                base_cache_key,
+                lambda: self._load_base_response(slate_date=slate_date, window=window, base_cache_key=base_cache_key),
+            )
+
+        try:
+            live_injuries, injury_index = await self.injury_service.fetch_injuries_indexed(slate_date)
+        except Exception as exc:
+            self._logger.warning("Live injury overlay failed for %s: %s", slate_date.isoformat(), exc)
+            live_injuries, injury_index = base_response.injuries, None
+
+        overlay = self._overlays.get(base_cache_key)
+        if overlay is not None and overlay[0] is base_response and overlay[1] is live_injuries:
+            return overlay[2]
+        response = self._with_injury_overlay(
+            base_response=base_response,
+            injuries=live_injuries,
+            injury_index=injury_index,
+        )
+        self._overlays.pop(base_cache_key, None)
+        self._overlays[base_cache_key] = (base_response, live_injuries, response)
+        while len(self._overlays) > _MAX_CACHED_OVERLAYS:
+            del self._overlays[next(iter(self._overlays))]
+        return response
+
+    async def _load_base_response(self, slate_date: date, window: Window, base_cache_key: str) -> MatchupResponse:
         base_response = self.cache.get(base_cache_key)
         expected_as_of = as_of_date_for_slate(slate_date)
 
@@ -75,55 +182,70 @@ class MatchupService:
 
         if base_response is None:
             base_response = await self._compute_matchups(slate_date=slate_date, window=window)
-            try:
-                self.snapshot_store.upsert(base_response)
-            except Exception as exc:
-                self._logger.warning(
-                    "Failed to persist snapshot for %s window=%s: %s",
-                    slate_date.isoformat(),
-                    window.value,
-                    exc,
-                )
+            self._write_in_background(self._persist_snapshot, base_response)
             self.cache.set(base_cache_key, base_response)
+        return base_response
+
+    def _write_in_background(self, write: Callable[..., None], *args: Any) -> None:
+        # Snapshot-store writes are blocking DB I/O that the response does not depend on; run them in a
+        # worker thread and keep a reference so the task is not garbage collected mid-flight.
+        task = asyncio.create_task(asyncio.to_thread(write, *args))
+        self._background_writes.add(task)
+        task.add_done_callback(self._background_writes.discard)
 
+    async def drain_background_writes(self) -> None:
+        if self._background_writes:
+            await asyncio.gather(*self._background_writes, return_exceptions=True)
+
+    def _persist_snapshot(self, response: MatchupResponse) -> None:
         try:
-            live_injuries = await self.injury_service.fetch_injuries(slate_date)
+            self.snapshot_store.upsert(response)
         except Exception as exc:
-            self._logger.warning("Live injury overlay failed for %s: %s", slate_date.isoformat(), exc)
-            live_injuries = base_response.injuries
+            self._logger.warning(
+                "Failed to persist snapshot for %s window=%s: %s",
+                response.slate_date.isoformat(),
+                response.window.value,
+                exc,
+            )
 
-        return self._with_injury_overlay(base_response=base_response, injuries=live_injuries)
+    def _persist_player_cards(self, player_cards: List, season: str, as_of_date: date) -> None:
+        try:
+            stored = self.snapshot_store.upsert_player_cards(player_cards)
+            self._logger.info(
+                "Upserted %d player cards for season=%s as_of=%s",
+                stored,
+                season,
+                as_of_date.isoformat(),
+            )
+        except Exception as exc:
+            self._logger.warning(
+                "Failed to upsert player cards for season=%s as_of=%s: %s",
+                season,
+                as_of_date.isoformat(),
+                exc,
+            )
 
-    def _with_injury_overlay(self, base_response: MatchupResponse, injuries: List) -> MatchupResponse:
-        injury_lookup_by_team_name: Dict[tuple[str, str], str] = {}
-        injury_lookup_by_name: Dict[str, str] = {}
-        for injury in injuries:
-            normalized_name = injury.player_name.upper()
-            injury_lookup_by_team_name[(injury.team.upper(), normalized_name)] = injury.status
-            injury_lookup_by_name[normalized_name] = injury.status
+    def _with_injury_overlay(
+        self,
+        base_response: MatchupResponse,
+        injuries: List,
+        injury_index: InjuryIndex | None = None,
+    ) -> MatchupResponse:
+        injury_lookup_by_team_name, injury_lookup_by_name = injury_index or build_injury_index(injuries)
 
         players: List[PlayerMatchup] = []
         for player in base_response.players:
-            normalized_name = player.player_name.upper()
-            status = injury_lookup_by_team_name.get((player.team.upper(), normalized_name))
+            team_name_key, normalized_name = _player_lookup_keys(player)
+            status = injury_lookup_by_team_name.get(team_name_key)
             if status is None:
                 status = injury_lookup_by_name.get(normalized_name)
-            players.append(
-                PlayerMatchup(
-                    player_id=player.player_id,
-                    player_name=player.player_name,
-                    team=player.team,
-                    opponent=player.opponent,
-                    position_group=player.position_group,
-                    avg_minutes=player.avg_minutes,
-                    injury_status=status,
-                    environment_score=player.environment_score,
-                    stat_ranks=player.stat_ranks,
-                    stat_tiers=player.stat_tiers,
-                )
-            )
+            if status == player.injury_status:
+                players.append(player)
+            else:
+                # model_copy skips validation and keeps the cached name key.
+                players.append(player.model_copy(update={"injury_status": status}))
 
-        return MatchupResponse(
+        return MatchupResponse.model_construct(
             slate_date=base_response.slate_date,
             as_of_date=base_response.as_of_date,
             window=base_response.window,
@@ -163,8 +285,8 @@ class MatchupService:
 
             self.snapshot_store.upsert(season_response)
             self.snapshot_store.upsert(last10_response)
-            self.cache.set(f"matchups:{date_key}:{Window.season.value}", season_response)
-            self.cache.set(f"matchups:{date_key}:{Window.last10.value}", last10_response)
+            self.cache.set(_matchups_key(slate_date, Window.season.value), season_response)
+            self.cache.set(_matchups_key(slate_date, Window.last10.value), last10_response)
         else:
             cleared += self.snapshot_store.delete_slate(slate_date)
 
@@ -250,9 +372,8 @@ class MatchupService:
             as_of_date = as_of_date_for_slate(slate_date)
             season = season_label_for_date(slate_date)
             games = self.nba_service.fetch_slate_games(slate_date)
-            slate_teams = {team for game in games for team in (game.away_team, game.home_team)}
-            team_token = ",".join(sorted(slate_teams)) if slate_teams else "none"
-            snapshot_cache_key = f"snapshot:{season}:{as_of_date.isoformat()}:{team_token}"
+            slate_teams, team_token, _ = _slate_layout_for_games(games)
+            snapshot_cache_key = _snapshot_key(season, as_of_date, team_token)
 
             snapshot = self.cache.get(snapshot_cache_key)
             if snapshot is None:
@@ -292,156 +413,182 @@ class MatchupService:
 
     async def get_game_lines(self, slate_date: date) -> GameLinesResponse:
         cache_key = f"game-lines:{slate_date.isoformat()}"
-        cached = self.cache.get(cache_key)
-        if isinstance(cached, GameLinesResponse):
+        cached = self.cache.get_typed(cache_key, GameLinesResponse)
+        if cached is not None:
             return cached
 
-        games = self.nba_service.fetch_slate_games(slate_date)
-        lines = await self.odds_api_service.fetch_game_lines(games)
-        has_live_lines = any(
-            line.away_spread is not None or line.home_spread is not None or line.game_total is not None
-            for line in lines
-        )
-        if not has_live_lines:
-            lines = await self.sports_mcp_service.fetch_game_lines(games)
+        games = await asyncio.to_thread(self.nba_service.fetch_slate_games, slate_date)
+        # The MCP fallback is started alongside the Odds API so an empty primary does not add a second
+        # round trip; it is cancelled when the primary has live lines.
+        mcp_task = asyncio.create_task(self.sports_mcp_service.fetch_game_lines(games))
+        try:
+            lines = await self.odds_api_service.fetch_game_lines(games)
+            has_live_lines = any(
+                line.away_spread is not None or line.home_spread is not None or line.game_total is not None
+                for line in lines
+            )
+            if not has_live_lines:
+                lines = await mcp_task
+        finally:
+            if not mcp_task.done():
+                mcp_task.cancel()
+            elif not mcp_task.cancelled():
+                # Marks a failed fallback as retrieved when the primary's lines were used instead.
+                mcp_task.exception()
         response = GameLinesResponse(slate_date=slate_date, lines=lines)
         self.cache.set(cache_key, response)
         return response
 
-    async def _compute_matchups(self, slate_date: date, window: Window) -> MatchupResponse:
-        started = perf_counter()
-        games = self.nba_service.fetch_slate_games(slate_date)
-        scoreboard_elapsed = perf_counter() - started
+    async def _safe_fetch_injuries(self, slate_date: date) -> tuple[List, InjuryIndex]:
         try:
-            injuries = await self.injury_service.fetch_injuries(slate_date)
+            return await self.injury_service.fetch_injuries_indexed(slate_date)
         except Exception as exc:
             self._logger.warning("Injury fetch failed for %s: %s", slate_date.isoformat(), exc)
-            injuries = []
-        injury_elapsed = perf_counter() - started
+            return [], ({}, {})
+
+    def _snapshot_index(self, snapshot_cache_key: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        entry = self._snapshot_indexes.get(snapshot_cache_key)
+        if entry is None or entry[0] is not snapshot:
+            entry = (snapshot, {})
+            self._snapshot_indexes.pop(snapshot_cache_key, None)
+            self._snapshot_indexes[snapshot_cache_key] = entry
+            while len(self._snapshot_indexes) > _MAX_SNAPSHOT_INDEXES:
+                del self._snapshot_indexes[next(iter(self._snapshot_indexes))]
+        return entry[1]
+
+    def _flat_ranks(
+        self,
+        snapshot_cache_key: str,
+        snapshot: Dict[str, Any],
+        window: Window,
+    ) -> Dict[tuple[str, str, str], int]:
+        # Flattened once per cached snapshot window so the per-player loop does a single lookup per stat.
+        index = self._snapshot_index(snapshot_cache_key, snapshot)
+        flat = index.get(window.value)
+        if flat is None:
+            flat = index[window.value] = {
+                (opponent, group, stat_key): int(rank)
+                for opponent, groups in snapshot[window.value]["ranks"].items()
+                for group, stats in groups.items()
+                for stat_key, rank in stats.items()
+            }
+        return flat
+
+    def _rotation_pool_by_team(self, snapshot_cache_key: str, snapshot: Dict[str, Any]) -> Dict[str, List[dict]]:
+        index = self._snapshot_index(snapshot_cache_key, snapshot)
+        by_team = index.get("rotation_pool_by_team")
+        if by_team is None:
+            by_team = index["rotation_pool_by_team"] = {}
+            for player in snapshot["rotation_pool"]:
+                by_team.setdefault(player["team"], []).append(player)
+        return by_team
 
-        opponent_map: Dict[str, str] = {}
-        slate_teams: set[str] = set()
-        for game in games:
-            opponent_map[game.away_team] = game.home_team
-            opponent_map[game.home_team] = game.away_team
-            slate_teams.add(game.away_team)
-            slate_teams.add(game.home_team)
+    async def _compute_matchups(self, slate_date: date, window: Window) -> MatchupResponse:
+        total_timer = _Timer()
+        with _Timer() as fetch_timer:
+            # The scoreboard call is blocking nba_api I/O; run it in a worker thread alongside the injury fetch.
+            games, (injuries, (injury_lookup, _)) = await asyncio.gather(
+                asyncio.to_thread(self.nba_service.fetch_slate_games, slate_date),
+                self._safe_fetch_injuries(slate_date),
+            )
 
+        slate_teams, team_token, opponent_map = _slate_layout_for_games(games)
         as_of_date = as_of_date_for_slate(slate_date)
         season = season_label_for_date(slate_date)
-        team_token = ",".join(sorted(slate_teams)) if slate_teams else "none"
 
-        snapshot_cache_key = f"snapshot:{season}:{as_of_date.isoformat()}:{team_token}"
+        snapshot_cache_key = _snapshot_key(season, as_of_date, team_token)
         snapshot = self.cache.get(snapshot_cache_key)
         if snapshot is None:
-            snapshot_start = perf_counter()
-            try:
-                snapshot = self.nba_service.build_snapshot(
-                    as_of_date=as_of_date,
-                    season=season,
-                    slate_teams=slate_teams,
-                )
-            except Exception as exc:
-                self._logger.warning(
-                    "Snapshot build failed for season=%s as_of=%s: %s",
+            with _Timer() as snapshot_timer:
+                try:
+                    snapshot = self.nba_service.build_snapshot(
+                        as_of_date=as_of_date,
+                        season=season,
+                        slate_teams=slate_teams,
+                    )
+                except Exception as exc:
+                    self._logger.warning(
+                        "Snapshot build failed for season=%s as_of=%s: %s",
+                        season,
+                        as_of_date.isoformat(),
+                        exc,
+                    )
+                    snapshot = {
+                        "rotation_pool": [],
+                        "season": {"ranks": {}, "environment": {}},
+                        "last10": {"ranks": {}, "environment": {}},
+                    }
+            self.cache.set(snapshot_cache_key, snapshot)
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "Snapshot built for %s %s in %.2fs (teams=%d)",
                     season,
                     as_of_date.isoformat(),
-                    exc,
+                    snapshot_timer.elapsed,
+                    len(slate_teams),
                 )
-                snapshot = {
-                    "rotation_pool": [],
-                    "season": {"ranks": {}, "environment": {}},
-                    "last10": {"ranks": {}, "environment": {}},
-                }
-            self.cache.set(snapshot_cache_key, snapshot)
-            self._logger.info(
-                "Snapshot built for %s %s in %.2fs (teams=%d)",
-                season,
-                as_of_date.isoformat(),
-                perf_counter() - snapshot_start,
-                len(slate_teams),
-            )
 
         window_payload = snapshot[window.value]
-        ranks = window_payload["ranks"]
+        ranks = self._flat_ranks(snapshot_cache_key, snapshot, window)
         environment = window_payload["environment"]
 
-        injury_lookup: Dict[tuple[str, str], str] = {}
-        for injury in injuries:
-            injury_lookup[(injury.team, injury.player_name.upper())] = injury.status
-
-        players: List[PlayerMatchup] = []
-        for player in snapshot["rotation_pool"]:
-            team = player["team"]
-            if team not in slate_teams:
-                continue
-
-            opponent = opponent_map.get(team)
-            if not opponent:
-                continue
-
-            group = player["position_group"]
-            stat_ranks: Dict[str, int] = {}
-            stat_tiers = {}
-
-            for stat_key in SUPPORTED_STATS:
-                display_stat = DISPLAY_STATS[stat_key]
-                rank = int(ranks.get(opponent, {}).get(group, {}).get(stat_key, 30))
-                stat_ranks[display_stat] = rank
-                stat_tiers[display_stat] = to_tier(rank)
-
-            players.append(
-                PlayerMatchup(
+        rank_rows: Dict[tuple[str, str], tuple[Dict[str, int], Dict[str, MatchupTier], int]] = {}
+        # Sort keys are computed while building each player, so sorting never revisits the rank dicts.
+        keyed_players: List[tuple[tuple[int, float, str], PlayerMatchup]] = []
+        # Only the slate's teams are visited instead of filtering every pooled player.
+        rotation_pool_by_team = self._rotation_pool_by_team(snapshot_cache_key, snapshot)
+        for team, opponent in opponent_map.items():
+            environment_score = float(environment.get(opponent, 50.0))
+            for player in rotation_pool_by_team.get(team, ()):
+                group = player["position_group"]
+                # Every player facing the same opponent at the same position shares one rank/tier row.
+                rank_row = rank_rows.get((opponent, group))
+                if rank_row is None:
+                    stat_ranks = {
+                        display_stat: ranks.get((opponent, group, stat_key), 30)
+                        for stat_key, display_stat in DISPLAY_STAT_PAIRS
+                    }
+                    stat_tiers = {display_stat: TIERS_BY_RANK[rank] for display_stat, rank in stat_ranks.items()}
+                    best_rank = min(stat_ranks.values()) if stat_ranks else 30
+                    rank_row = rank_rows[(opponent, group)] = (stat_ranks, stat_tiers, best_rank)
+                stat_ranks, stat_tiers, best_rank = rank_row
+
+                name_key = player["player_name"].upper()
+                team_name_key = injury_lookup_key(team, name_key)
+                matchup = PlayerMatchup.model_construct(
                     player_id=int(player["player_id"]),
                     player_name=player["player_name"],
                     team=team,
                     opponent=opponent,
-                    position_group=group,
+                    position_group=PositionGroup(group),
                     avg_minutes=float(player["avg_minutes"]),
-                    injury_status=injury_lookup.get((team, player["player_name"].upper())),
-                    environment_score=float(environment.get(opponent, 50.0)),
+                    injury_status=injury_lookup.get(team_name_key),
+                    environment_score=environment_score,
                     stat_ranks=stat_ranks,
                     stat_tiers=stat_tiers,
                 )
-            )
+                matchup._name_key = name_key
+                matchup._team_name_key = team_name_key
+                keyed_players.append(((best_rank, -environment_score, matchup.player_name), matchup))
 
-        players.sort(
-            key=lambda player: (
-                min(player.stat_ranks.values()) if player.stat_ranks else 30,
-                -player.environment_score,
-                player.player_name,
-            )
-        )
+        keyed_players.sort(key=itemgetter(0))
+        players = [matchup for _, matchup in keyed_players]
 
-        self._logger.info(
-            "Computed matchups for %s window=%s in %.2fs (scoreboard=%.2fs injuries=%.2fs players=%d)",
-            slate_date.isoformat(),
-            window.value,
-            perf_counter() - started,
-            scoreboard_elapsed,
-            injury_elapsed - scoreboard_elapsed,
-            len(players),
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Computed matchups for %s window=%s in %.2fs (scoreboard+injuries=%.2fs players=%d)",
+                slate_date.isoformat(),
+                window.value,
+                total_timer.elapsed,
+                fetch_timer.elapsed,
+                len(players),
+            )
 
         player_cards = snapshot.get("player_cards", [])
         if player_cards:
-            try:
-                stored = self.snapshot_store.upsert_player_cards(player_cards)
-                self._logger.info(
-                    "Upserted %d player cards for season=%s as_of=%s",
-                    stored,
-                    season,
-                    as_of_date.isoformat(),
-                )
-            except Exception as exc:
-                self._logger.warning(
-                    "Failed to upsert player cards for season=%s as_of=%s: %s",
-                    season,
-                    as_of_date.isoformat(),
-                    exc,
-                )
+            self._write_in_background(self._persist_player_cards, player_cards, season, as_of_date)
 
-        return MatchupResponse(
+        return MatchupResponse.model_construct(
             slate_date=slate_date,
             as_of_date=as_of_date,
             window=window,
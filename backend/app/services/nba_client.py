@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timezone
+from functools import lru_cache
 import logging
 import os
 from pathlib import Path
 import re
-from time import perf_counter
+import sys
+import threading
+from time import monotonic, perf_counter, sleep
 from typing import Dict, Iterable, List
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 from nba_api.stats.endpoints import (
     commonteamroster,
@@ -24,6 +28,14 @@ from app.models import Game, PlayerCardResponse, PlayerCardWindow, PositionGroup
 from app.services.scoring import build_environment_scores, build_rank_tables
 from app.utils import SUPPORTED_STATS, map_position_groups, parse_matchup_opponent, season_label_for_date
 
+_TIPOFF_ET_RE = re.compile(r"(\d{1,2}):(\d{2})\s*([AP]M)\s*ET")
+_MATCHUP_HOME_RE = re.compile(r" VS[. ]")
+
+
+@lru_cache(maxsize=128)
+def _upper_column_lookup(columns: tuple[str, ...]) -> dict[str, str]:
+    return {column.upper(): column for column in columns}
+
 
 class NBADataService:
     def __init__(self, enable_roster_fetch: bool = False) -> None:
@@ -32,14 +44,21 @@ class NBADataService:
         self._scoreboard_timeout_seconds = float(os.getenv("NBA_SCOREBOARD_TIMEOUT_SECONDS", "15"))
         self._scoreboard_retries = max(1, int(os.getenv("NBA_SCOREBOARD_RETRIES", "4")))
         self._fallback_timeout_seconds = float(os.getenv("NBA_FALLBACK_TIMEOUT_SECONDS", "12"))
+        self._stats_rpm_limit = max(1, int(os.getenv("NBA_STATS_RPM", "30")))
+        self._stats_rpm = self._stats_rpm_limit
+        self._stats_calls: deque[float] = deque()
+        self._stats_lock = threading.Lock()
         self._teams = nba_teams.get_teams()
-        self.id_to_abbr = {int(team["id"]): str(team["abbreviation"]).upper() for team in self._teams}
+        self.id_to_abbr = {int(team["id"]): sys.intern(str(team["abbreviation"]).upper()) for team in self._teams}
         self.abbr_to_id = {str(team["abbreviation"]).upper(): int(team["id"]) for team in self._teams}
         self.team_abbrs = sorted(self.id_to_abbr.values())
+        self._abbr_intern = {abbr: abbr for abbr in self.team_abbrs}
         self._roster_position_cache: dict[tuple[str, int], dict[int, list[PositionGroup]]] = {}
         self._roster_player_ids_cache: dict[tuple[str, int], set[int] | None] = {}
         self._season_player_logs_cache: dict[str, pd.DataFrame] = {}
         self._season_team_logs_cache: dict[str, pd.DataFrame] = {}
+        self._season_team_log_slate_cache: dict[str, pd.DataFrame] = {}
+        self._season_date_summaries: dict[tuple[str, str], tuple[pd.DataFrame, date | None, bool]] = {}
         self._raw_data_dir = Path(__file__).resolve().parents[2] / ".data" / "raw"
 
     def fetch_slate_games(self, slate_date: date) -> List[Game]:
@@ -89,7 +108,7 @@ class NBADataService:
 
     @staticmethod
     def _parse_tipoff_utc(status_text: str, slate_date: date) -> str | None:
-        match = re.search(r"(\d{1,2}):(\d{2})\s*([AP]M)\s*ET", status_text.upper())
+        match = _TIPOFF_ET_RE.search(status_text.upper())
         if not match:
             return None
         hour = int(match.group(1))
@@ -117,34 +136,45 @@ class NBADataService:
 
         team_lookup: Dict[tuple[str, int], str] = {}
         if not line_scores.empty:
-            for row in line_scores.to_dict("records"):
-                game_id = str(row.get("GAME_ID", ""))
-                team_id = int(row.get("TEAM_ID", 0)) if row.get("TEAM_ID") is not None else 0
-                abbr = str(row.get("TEAM_ABBREVIATION", "")).upper()
+            for raw_game_id, raw_team_id, raw_abbr in zip(
+                self._column_values(line_scores, "GAME_ID", ""),
+                self._column_values(line_scores, "TEAM_ID", None),
+                self._column_values(line_scores, "TEAM_ABBREVIATION", ""),
+            ):
+                game_id = str(raw_game_id)
+                team_id = int(raw_team_id) if raw_team_id is not None else 0
+                abbr = self._canonical_abbr(raw_abbr)
                 if game_id and team_id and abbr:
                     team_lookup[(game_id, team_id)] = abbr
 
         games: list[Game] = []
-        for row in headers.to_dict("records"):
-            game_id = str(row.get("GAME_ID", "")).strip()
-            home_id = int(row.get("HOME_TEAM_ID", 0) or 0)
-            away_id = int(row.get("VISITOR_TEAM_ID", 0) or 0)
+        for raw_game_id, raw_home_id, raw_away_id, home_abbr, away_abbr, status_text in zip(
+            self._column_values(headers, "GAME_ID", ""),
+            self._column_values(headers, "HOME_TEAM_ID", 0),
+            self._column_values(headers, "VISITOR_TEAM_ID", 0),
+            self._column_values(headers, "HOME_TEAM_ABBREVIATION", ""),
+            self._column_values(headers, "VISITOR_TEAM_ABBREVIATION", ""),
+            self._column_values(headers, "GAME_STATUS_TEXT", ""),
+        ):
+            game_id = str(raw_game_id).strip()
+            home_id = int(raw_home_id or 0)
+            away_id = int(raw_away_id or 0)
 
             home = (
                 team_lookup.get((game_id, home_id))
                 or self.id_to_abbr.get(home_id)
-                or str(row.get("HOME_TEAM_ABBREVIATION", "")).upper()
+                or self._canonical_abbr(home_abbr)
             )
             away = (
                 team_lookup.get((game_id, away_id))
                 or self.id_to_abbr.get(away_id)
-                or str(row.get("VISITOR_TEAM_ABBREVIATION", "")).upper()
+                or self._canonical_abbr(away_abbr)
             )
 
             if not game_id or not home or not away:
                 continue
 
-            game_status_text = str(row.get("GAME_STATUS_TEXT", "") or "")
+            game_status_text = str(status_text or "")
             games.append(
                 Game(
                     game_id=game_id,
@@ -155,6 +185,13 @@ class NBADataService:
             )
         return games
 
+    @staticmethod
+    def _column_values(frame: pd.DataFrame, column: str, default: object) -> list:
+        # Column-wise access for row loops: one list per column instead of a dict per row.
+        if column in frame.columns:
+            return frame[column].tolist()
+        return [default] * len(frame)
+
     def _fetch_slate_games_from_fallback(self, slate_date: date) -> list[Game]:
         season = season_label_for_date(slate_date)
         cached_team_logs = self._get_cached_team_logs_for_season(season)
@@ -187,11 +224,17 @@ class NBADataService:
 
     def _get_cached_team_logs_for_season(self, season: str) -> pd.DataFrame:
         cached = self._season_team_logs_cache.get(season)
+        if cached is None:
+            cached = self._season_team_log_slate_cache.get(season)
         if cached is not None:
             return cached
-        loaded = self._read_cached_frame(self._raw_cache_path("team_logs", season))
+        # Slate lookups only need four columns; read just those instead of loading the full season frame.
+        loaded = self._read_cached_frame(
+            self._raw_cache_path("team_logs", season),
+            columns=["GAME_ID", "TEAM_ABBREVIATION", "MATCHUP", "GAME_DATE"],
+        )
         if loaded is not None:
-            self._season_team_logs_cache[season] = loaded
+            self._season_team_log_slate_cache[season] = loaded
             return loaded
         return pd.DataFrame()
 
@@ -206,51 +249,73 @@ class NBADataService:
         if not all([game_col, team_col, matchup_col, date_col]):
             return []
 
-        frame = team_logs_df[[game_col, team_col, matchup_col, date_col]].copy()
-        frame["_parsed_date"] = pd.to_datetime(frame[date_col], errors="coerce").dt.date
-        frame = frame[frame["_parsed_date"] == slate_date]
+        # Filter on the date first so only the slate's rows are materialized.
+        parsed_dates = self._parsed_dates(team_logs_df[date_col])
+        day_start = pd.Timestamp(slate_date)
+        on_slate = (parsed_dates >= day_start) & (parsed_dates < day_start + pd.Timedelta(days=1))
+
+        frame = team_logs_df.loc[on_slate, [game_col, team_col, matchup_col]]
         if frame.empty:
             return []
 
-        grouped: dict[str, dict[str, str]] = defaultdict(dict)
-        for row in frame.to_dict("records"):
-            game_id = str(row.get(game_col, "")).strip()
-            team = str(row.get(team_col, "")).strip().upper()
-            matchup = str(row.get(matchup_col, "")).upper()
-            if not game_id or not team:
-                continue
-            grouped[game_id][team] = matchup
-
-        games: list[Game] = []
-        for game_id, team_matchups in sorted(grouped.items()):
-            home_team: str | None = None
-            away_team: str | None = None
-            teams = list(team_matchups.keys())
-            for team, matchup in team_matchups.items():
-                if " VS." in matchup or " VS " in matchup:
-                    home_team = team
-                elif "@" in matchup:
-                    away_team = team
-
-            if not home_team and len(teams) == 2 and away_team in teams:
-                home_team = teams[0] if teams[1] == away_team else teams[1]
-            if not away_team and len(teams) == 2 and home_team in teams:
-                away_team = teams[0] if teams[1] == home_team else teams[1]
-
-            if not home_team or not away_team:
-                continue
+        matchups = frame[matchup_col].astype(str).str.upper()
+        rows = pd.DataFrame(
+            {
+                "game_id": frame[game_col].astype(str).str.strip(),
+                "team": frame[team_col].astype(str).str.strip().str.upper(),
+                "is_home": matchups.str.contains(_MATCHUP_HOME_RE),
+                "is_away": matchups.str.contains("@", regex=False),
+            }
+        )
+        rows = rows[(rows["game_id"] != "") & (rows["team"] != "")]
+        # Last matchup wins per team, kept at the team's first position within its game.
+        rows = rows.groupby(["game_id", "team"], sort=False).last().reset_index()
+        if rows.empty:
+            return []
 
-            games.append(
-                Game(
-                    game_id=game_id,
-                    away_team=away_team,
-                    home_team=home_team,
-                    start_time_utc=None,
-                )
+        by_game = rows.groupby("game_id")["team"]
+        slate = pd.DataFrame(
+            {
+                "first": by_game.first(),
+                "last": by_game.last(),
+                "count": by_game.size(),
+                "home": rows[rows["is_home"]].drop_duplicates("game_id", keep="last").set_index("game_id")["team"],
+                "away": rows[~rows["is_home"] & rows["is_away"]]
+                .drop_duplicates("game_id", keep="last")
+                .set_index("game_id")["team"],
+            }
+        )
+        pair = slate["count"] == 2
+        infer_home = slate["home"].isna() & slate["away"].notna() & pair
+        slate.loc[infer_home, "home"] = slate["first"].where(slate["away"] != slate["first"], slate["last"])
+        infer_away = slate["away"].isna() & slate["home"].notna() & pair
+        slate.loc[infer_away, "away"] = slate["first"].where(slate["home"] != slate["first"], slate["last"])
+        slate = slate.dropna(subset=["home", "away"])
+
+        games = [
+            Game(
+                game_id=game_id,
+                away_team=self._canonical_abbr(away_team),
+                home_team=self._canonical_abbr(home_team),
+                start_time_utc=None,
             )
-
+            for game_id, away_team, home_team in zip(
+                slate.index.tolist(),
+                slate["away"].tolist(),
+                slate["home"].tolist(),
+            )
+        ]
         return games
 
+    def _canonical_abbr(self, raw: object) -> str:
+        # Known abbreviations resolve to one shared string; upper() only runs for unexpected spellings.
+        text = str(raw)
+        interned = self._abbr_intern.get(text)
+        if interned is not None:
+            return interned
+        upper = text.upper()
+        return self._abbr_intern.get(upper, upper)
+
     @staticmethod
     def _dedupe_games_by_matchup(games: list[Game]) -> list[Game]:
         if not games:
@@ -278,20 +343,37 @@ class NBADataService:
 
     def fetch_player_logs(self, as_of_date: date, season: str) -> pd.DataFrame:
         season_logs = self._get_season_player_logs(season=season, as_of_date=as_of_date)
-        return self._filter_logs_by_as_of(season_logs, as_of_date=as_of_date)
+        return self._season_logs_as_of("player_logs", season, season_logs, as_of_date)
 
     def fetch_player_logs_cached_only(self, as_of_date: date, season: str) -> pd.DataFrame:
         season_logs = self._get_season_player_logs_cached_only(season=season)
-        return self._filter_logs_by_as_of(season_logs, as_of_date=as_of_date)
+        return self._season_logs_as_of("player_logs", season, season_logs, as_of_date)
 
     def fetch_team_logs(self, as_of_date: date, season: str) -> pd.DataFrame:
         season_logs = self._get_season_team_logs(season=season, as_of_date=as_of_date)
-        return self._filter_logs_by_as_of(season_logs, as_of_date=as_of_date)
+        return self._season_logs_as_of("team_logs", season, season_logs, as_of_date)
 
     def fetch_team_logs_cached_only(self, as_of_date: date, season: str) -> pd.DataFrame:
         season_logs = self._get_season_team_logs_cached_only(season=season)
+        return self._season_logs_as_of("team_logs", season, season_logs, as_of_date)
+
+    def _season_logs_as_of(self, prefix: str, season: str, season_logs: pd.DataFrame, as_of_date: date) -> pd.DataFrame:
+        # Requests on or after the newest cached game want the whole frame; skip the per-row date scan.
+        max_game_date, all_dated = self._season_date_summary(prefix, season, season_logs)
+        if all_dated and max_game_date is not None and as_of_date >= max_game_date:
+            return season_logs
         return self._filter_logs_by_as_of(season_logs, as_of_date=as_of_date)
 
+    def _season_date_summary(self, prefix: str, season: str, season_logs: pd.DataFrame) -> tuple[date | None, bool]:
+        cached = self._season_date_summaries.get((prefix, season))
+        if cached is not None and cached[0] is season_logs:
+            return cached[1], cached[2]
+        max_game_date = self._extract_max_game_date(season_logs)
+        date_col = self._pick_column(season_logs, ["GAME_DATE", "GAME_DATE_EST"]) if not season_logs.empty else None
+        all_dated = date_col is not None and bool(self._parsed_dates(season_logs[date_col]).notna().all())
+        self._season_date_summaries[(prefix, season)] = (season_logs, max_game_date, all_dated)
+        return max_game_date, all_dated
+
     def _get_season_player_logs(self, season: str, as_of_date: date) -> pd.DataFrame:
         cached = self._season_player_logs_cache.get(season)
         if cached is None:
@@ -299,12 +381,16 @@ class NBADataService:
             if cached is not None:
                 self._season_player_logs_cache[season] = cached
 
-        if cached is not None:
-            max_cached_date = self._extract_max_game_date(cached)
-            if max_cached_date is not None and max_cached_date >= as_of_date:
-                return cached
+        max_cached_date = self._season_date_summary("player_logs", season, cached)[0] if cached is not None else None
+        if max_cached_date is not None and max_cached_date >= as_of_date:
+            return cached
 
-        fetched = self._fetch_player_logs_remote_full_season(season=season)
+        fetched = None
+        if max_cached_date is not None:
+            recent = self._fetch_player_logs_remote_full_season(season=season, date_from=max_cached_date)
+            fetched = self._merge_recent_logs(cached, recent, ("PLAYER_ID", "GAME_ID"))
+        if fetched is None:
+            fetched = self._fetch_player_logs_remote_full_season(season=season)
         if not fetched.empty:
             self._season_player_logs_cache[season] = fetched
             self._write_cached_frame(self._raw_cache_path("player_logs", season), fetched)
@@ -329,12 +415,16 @@ class NBADataService:
             if cached is not None:
                 self._season_team_logs_cache[season] = cached
 
-        if cached is not None:
-            max_cached_date = self._extract_max_game_date(cached)
-            if max_cached_date is not None and max_cached_date >= as_of_date:
-                return cached
+        max_cached_date = self._season_date_summary("team_logs", season, cached)[0] if cached is not None else None
+        if max_cached_date is not None and max_cached_date >= as_of_date:
+            return cached
 
-        fetched = self._fetch_team_logs_remote_full_season(season=season)
+        fetched = None
+        if max_cached_date is not None:
+            recent = self._fetch_team_logs_remote_full_season(season=season, date_from=max_cached_date)
+            fetched = self._merge_recent_logs(cached, recent, ("TEAM_ID", "GAME_ID"))
+        if fetched is None:
+            fetched = self._fetch_team_logs_remote_full_season(season=season)
         if not fetched.empty:
             self._season_team_logs_cache[season] = fetched
             self._write_cached_frame(self._raw_cache_path("team_logs", season), fetched)
@@ -352,31 +442,75 @@ class NBADataService:
             return loaded
         return pd.DataFrame()
 
-    def _fetch_player_logs_remote_full_season(self, season: str) -> pd.DataFrame:
+    @classmethod
+    def _merge_recent_logs(cls, cached: pd.DataFrame, recent: pd.DataFrame, keys: tuple[str, ...]) -> pd.DataFrame | None:
+        # Re-pulled rows replace their cached copies; None asks the caller for a full-season fetch instead.
+        if recent.empty:
+            return recent
+        if not all(key in cached.columns and key in recent.columns for key in keys):
+            return None
+        merged = pd.concat([cached, recent], ignore_index=True).drop_duplicates(
+            subset=list(keys), keep="last", ignore_index=True
+        )
+        # Categoricals with different categories concatenate back to object; re-encode them.
+        return cls._normalize_log_dtypes(merged)
+
+    def _fetch_player_logs_remote_full_season(self, season: str, date_from: date | None = None) -> pd.DataFrame:
+        self._acquire_stats_slot()
         try:
             endpoint = playergamelogs.PlayerGameLogs(
                 season_nullable=season,
                 season_type_nullable="Regular Season",
+                date_from_nullable=date_from.strftime("%m/%d/%Y") if date_from else "",
             )
             frames = endpoint.get_data_frames()
-            return frames[0] if frames else pd.DataFrame()
+            self._record_stats_outcome(None)
+            return self._normalize_log_dtypes(frames[0]) if frames else pd.DataFrame()
         except Exception as exc:
+            self._record_stats_outcome(exc)
             self._logger.warning("Player logs fetch failed for season=%s: %s", season, exc)
             return pd.DataFrame()
 
-    def _fetch_team_logs_remote_full_season(self, season: str) -> pd.DataFrame:
+    def _fetch_team_logs_remote_full_season(self, season: str, date_from: date | None = None) -> pd.DataFrame:
+        self._acquire_stats_slot()
         try:
             endpoint = leaguegamefinder.LeagueGameFinder(
                 player_or_team_abbreviation="T",
                 season_nullable=season,
                 season_type_nullable="Regular Season",
+                date_from_nullable=date_from.strftime("%m/%d/%Y") if date_from else "",
             )
             frames = endpoint.get_data_frames()
-            return frames[0] if frames else pd.DataFrame()
+            self._record_stats_outcome(None)
+            return self._normalize_log_dtypes(frames[0]) if frames else pd.DataFrame()
         except Exception as exc:
+            self._record_stats_outcome(exc)
             self._logger.warning("Team logs fetch failed for season=%s: %s", season, exc)
             return pd.DataFrame()
 
+    def _acquire_stats_slot(self) -> None:
+        # Sliding one-minute window shared by the parallel season log fetches.
+        while True:
+            with self._stats_lock:
+                now = monotonic()
+                while self._stats_calls and now - self._stats_calls[0] >= 60.0:
+                    self._stats_calls.popleft()
+                if len(self._stats_calls) < self._stats_rpm:
+                    self._stats_calls.append(now)
+                    return
+                wait_seconds = 60.0 - (now - self._stats_calls[0])
+            sleep(max(0.05, wait_seconds))
+
+    def _record_stats_outcome(self, exc: Exception | None) -> None:
+        with self._stats_lock:
+            if exc is None:
+                self._stats_rpm = min(self._stats_rpm_limit, self._stats_rpm + 1)
+                return
+            response = getattr(exc, "response", None)
+            if getattr(response, "status_code", None) == 429 or "429" in str(exc):
+                self._stats_rpm = max(1, self._stats_rpm // 2)
+                self._logger.warning("NBA stats rate limited; budget reduced to %d requests/min.", self._stats_rpm)
+
     def _build_player_baselines_from_logs(self, player_logs: pd.DataFrame) -> pd.DataFrame:
         if player_logs.empty:
             return pd.DataFrame()
@@ -411,11 +545,14 @@ class NBADataService:
             if value:
                 base_cols.append(value)
 
-        frame = player_logs[base_cols].copy()
-        frame["_parsed_date"] = pd.to_datetime(frame[date_col], errors="coerce")
-        for value in stat_column_map.values():
-            if value:
-                frame[value] = pd.to_numeric(frame[value], errors="coerce")
+        frame = player_logs[base_cols].assign(
+            _parsed_date=self._parsed_dates(player_logs[date_col]),
+            **{
+                value: pd.to_numeric(player_logs[value], errors="coerce")
+                for value in stat_column_map.values()
+                if value
+            },
+        )
 
         frame = frame.dropna(subset=[player_id_col, "_parsed_date", stat_column_map["MIN"]])
         if frame.empty:
@@ -426,30 +563,33 @@ class NBADataService:
             .drop_duplicates(subset=[player_id_col], keep="last")[[player_id_col, player_name_col, team_col]]
             .set_index(player_id_col)
         )
-        grouped = frame.groupby(player_id_col).agg({date_col: "count"})
-        grouped = grouped.rename(columns={date_col: "_GP"})
-        for name, column in stat_column_map.items():
-            if column:
-                grouped[f"_{name}_TOTAL"] = frame.groupby(player_id_col)[column].sum(min_count=1)
-            else:
-                grouped[f"_{name}_TOTAL"] = 0.0
-
-        grouped["_GP"] = grouped["_GP"].clip(lower=1)
-        for name in stat_column_map:
-            grouped[name] = grouped[f"_{name}_TOTAL"] / grouped["_GP"]
-
-        grouped["FG_PCT"] = grouped.apply(
-            lambda row: float(row["_FGM_TOTAL"] / row["_FGA_TOTAL"]) if row["_FGA_TOTAL"] > 0 else 0.0,
-            axis=1,
-        )
-        grouped["FG3_PCT"] = grouped.apply(
-            lambda row: float(row["_FG3M_TOTAL"] / row["_FG3A_TOTAL"]) if row["_FG3A_TOTAL"] > 0 else 0.0,
-            axis=1,
-        )
-        grouped["FT_PCT"] = grouped.apply(
-            lambda row: float(row["_FTM_TOTAL"] / row["_FTA_TOTAL"]) if row["_FTA_TOTAL"] > 0 else 0.0,
-            axis=1,
-        )
+        # One hash/gather pass over the player key for games played and every stat total.
+        player_groups = frame.groupby(player_id_col, sort=False)
+        stat_columns = list(dict.fromkeys(column for column in stat_column_map.values() if column))
+        totals = player_groups[stat_columns].sum(min_count=1)
+        games_played = player_groups[date_col].count().clip(lower=1)
+
+        # Build every output column against the group index and materialize the frame once, rather
+        # than inserting ~50 columns one at a time.
+        zeros = pd.Series(0.0, index=totals.index)
+        stat_totals = {name: totals[column] if column else zeros for name, column in stat_column_map.items()}
+        grouped_columns: dict[str, pd.Series | np.ndarray] = {
+            name: total / games_played for name, total in stat_totals.items()
+        }
+        # Vectorized percentages: players without attempts get 0.0 instead of a division by zero.
+        for pct_col, made_name, attempts_name in (
+            ("FG_PCT", "FGM", "FGA"),
+            ("FG3_PCT", "FG3M", "FG3A"),
+            ("FT_PCT", "FTM", "FTA"),
+        ):
+            attempts = stat_totals[attempts_name].to_numpy(dtype=float)
+            grouped_columns[pct_col] = np.divide(
+                stat_totals[made_name].to_numpy(dtype=float),
+                attempts,
+                out=np.zeros(len(attempts)),
+                where=attempts > 0,
+            )
+        grouped = pd.DataFrame(grouped_columns, index=totals.index)
 
         merged = latest_team.join(grouped, how="inner").reset_index()
         renamed = merged.rename(
@@ -509,11 +649,8 @@ class NBADataService:
         if not date_col:
             return logs_df
 
-        frame = logs_df.copy()
-        frame["_parsed_date"] = pd.to_datetime(frame[date_col], errors="coerce").dt.date
-        frame = frame[frame["_parsed_date"].notna()]
-        frame = frame[frame["_parsed_date"] <= as_of_date]
-        return frame.drop(columns=["_parsed_date"])
+        parsed = self._parsed_dates(logs_df[date_col])
+        return logs_df[parsed < pd.Timestamp(as_of_date) + pd.Timedelta(days=1)]
 
     def _extract_max_game_date(self, logs_df: pd.DataFrame) -> date | None:
         if logs_df.empty:
@@ -521,24 +658,62 @@ class NBADataService:
         date_col = self._pick_column(logs_df, ["GAME_DATE", "GAME_DATE_EST"])
         if not date_col:
             return None
-        parsed = pd.to_datetime(logs_df[date_col], errors="coerce").dt.date
-        parsed = parsed[parsed.notna()]
-        if parsed.empty:
+        latest = self._parsed_dates(logs_df[date_col]).max()
+        if pd.isna(latest):
             return None
-        return max(parsed)
+        return latest.date()
+
+    @staticmethod
+    def _parsed_dates(values: pd.Series) -> pd.Series:
+        # Cached season logs already carry datetime64 dates; to_datetime would still re-walk them.
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        return pd.to_datetime(values, errors="coerce")
+
+    @staticmethod
+    def _normalize_log_dtypes(frame: pd.DataFrame) -> pd.DataFrame:
+        # nba_api hands dates (and occasionally ids) back as strings; parse them once at load so
+        # the as-of filters and per-window sorts work on datetime64/Int64 columns.
+        conversions: dict[str, pd.Series] = {}
+        for column in ("GAME_DATE", "GAME_DATE_EST"):
+            if column in frame.columns and not pd.api.types.is_datetime64_any_dtype(frame[column]):
+                conversions[column] = pd.to_datetime(frame[column], errors="coerce")
+        for column in ("PLAYER_ID", "TEAM_ID"):
+            if column in frame.columns and frame[column].dtype == object:
+                conversions[column] = pd.to_numeric(frame[column], errors="coerce").astype("Int64")
+        # Team, matchup and game id strings repeat thousands of times per season; as categoricals they
+        # are stored once and factorize/group by their integer codes.
+        for column in ("TEAM_ABBREVIATION", "MATCHUP", "GAME_ID"):
+            if column in frame.columns and frame[column].dtype == object:
+                values = frame[column] if column == "GAME_ID" else frame[column].str.upper()
+                conversions[column] = values.astype("category")
+        return frame.assign(**conversions) if conversions else frame
 
     def _raw_cache_path(self, prefix: str, season: str) -> Path:
         season_token = season.replace("/", "-")
-        return self._raw_data_dir / f"{prefix}_{season_token}.pkl"
+        return self._raw_data_dir / f"{prefix}_{season_token}.feather"
 
-    def _read_cached_frame(self, path: Path) -> pd.DataFrame | None:
-        if not path.exists():
-            return None
+    def _read_cached_frame(self, path: Path, columns: list[str] | None = None) -> pd.DataFrame | None:
+        # Feather (Arrow IPC) reads columnar buffers directly; pickles from older runs, or from hosts
+        # without pyarrow, are still read from the sibling .pkl path.
+        legacy_path = path.with_suffix(".pkl")
         try:
-            loaded = pd.read_pickle(path)
+            if path.exists():
+                from pyarrow import feather
+
+                # Uncompressed files are memory-mapped, so numeric columns stay backed by the OS page
+                # cache and are shared by every worker process reading the same season file.
+                table = feather.read_table(path, columns=columns, memory_map=True, use_threads=True)
+                loaded = table.to_pandas(split_blocks=True)
+            elif legacy_path.exists():
+                loaded = pd.read_pickle(legacy_path)
+                if columns is not None and isinstance(loaded, pd.DataFrame):
+                    loaded = loaded[columns]
+            else:
+                return None
             if isinstance(loaded, pd.DataFrame):
                 self._logger.info("Loaded raw cache: %s (%d rows)", path.name, len(loaded))
-                return loaded
+                return self._normalize_log_dtypes(loaded)
         except Exception:
             return None
         return None
@@ -546,27 +721,36 @@ class NBADataService:
     def _write_cached_frame(self, path: Path, frame: pd.DataFrame) -> None:
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            frame.to_pickle(path)
+            try:
+                frame.reset_index(drop=True).to_feather(path, compression="uncompressed")
+                path.with_suffix(".pkl").unlink(missing_ok=True)
+                return
+            except Exception as exc:
+                # pyarrow missing or a column Arrow cannot type: keep the pickle format for this frame.
+                self._logger.info("Feather write unavailable for %s (%s); writing pickle.", path.name, exc)
+                path.unlink(missing_ok=True)
+            frame.to_pickle(path.with_suffix(".pkl"))
         except Exception as exc:
             self._logger.warning("Failed writing raw cache %s: %s", path.name, exc)
 
     def build_snapshot(self, as_of_date: date, season: str, slate_teams: set[str] | None = None) -> dict:
         started = perf_counter()
-        player_logs = self.fetch_player_logs(as_of_date=as_of_date, season=season)
-        player_logs_elapsed = perf_counter() - started
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            player_logs_future = executor.submit(self.fetch_player_logs, as_of_date=as_of_date, season=season)
+            team_logs_future = executor.submit(self.fetch_team_logs, as_of_date=as_of_date, season=season)
+            roster_future = executor.submit(self._build_roster_maps, season=season, team_abbr_filter=slate_teams)
+            player_logs = player_logs_future.result()
+            team_logs = team_logs_future.result()
+            logs_elapsed = perf_counter() - started
+            roster_positions, team_roster_player_ids, roster_team_by_player_id = roster_future.result()
+        roster_elapsed = perf_counter() - started
         player_baselines = self._build_player_baselines_from_logs(player_logs)
         player_logs_last10 = self._limit_player_logs_to_recent_games(player_logs, count=10)
         player_logs_last5 = self._limit_player_logs_to_recent_games(player_logs, count=5)
         player_baselines_last10 = self._build_player_baselines_from_logs(player_logs_last10)
         player_baselines_last5 = self._build_player_baselines_from_logs(player_logs_last5)
         baselines_elapsed = perf_counter() - started
-        team_logs = self.fetch_team_logs(as_of_date=as_of_date, season=season)
-        team_logs_elapsed = perf_counter() - started
         player_minutes = self._build_player_minutes_map(player_logs)
-        roster_positions = self._build_roster_position_map(season=season, team_abbr_filter=slate_teams)
-        team_roster_player_ids = self._build_team_roster_player_id_map(season=season, team_abbr_filter=slate_teams)
-        roster_team_by_player_id = self._build_roster_team_by_player_id(team_roster_player_ids)
-        roster_elapsed = perf_counter() - started
 
         rotation_pool, position_map = self._build_rotation_pool(
             baselines_df=player_baselines,
@@ -628,17 +812,16 @@ class NBADataService:
         self._logger.info(
             (
                 "Snapshot timing season=%s as_of=%s teams=%d total=%.2fs "
-                "(baselines=%.2fs player_logs=%.2fs team_logs=%.2fs roster=%.2fs rotation=%.2fs dvp=%.2fs)"
+                "(logs=%.2fs roster_wait=%.2fs baselines=%.2fs rotation=%.2fs dvp=%.2fs)"
             ),
             season,
             as_of_date.isoformat(),
             len(slate_teams or []),
             final_elapsed,
-            baselines_elapsed - player_logs_elapsed,
-            player_logs_elapsed,
-            team_logs_elapsed - baselines_elapsed,
-            roster_elapsed - team_logs_elapsed,
-            rotation_elapsed - roster_elapsed,
+            logs_elapsed,
+            roster_elapsed - logs_elapsed,
+            baselines_elapsed - roster_elapsed,
+            rotation_elapsed - baselines_elapsed,
             dvp_elapsed - rotation_elapsed,
         )
 
@@ -693,54 +876,51 @@ class NBADataService:
             "plus_minus_pg": self._pick_column(baselines_df, ["PLUS_MINUS"]),
         }
 
+        # Resolve team and eligibility column-wise, then walk the surviving rows once.
+        frame = baselines_df[baselines_df[id_col].notna() & (baselines_df[id_col] != 0)]
+        names = frame[name_col].astype(str).str.strip()
+        teams = frame[team_col].astype(str).str.strip().str.upper()
+        if roster_team_by_player_id:
+            roster_teams = frame[id_col].map(roster_team_by_player_id)
+            teams = roster_teams.where(roster_teams.notna() & (roster_teams != ""), teams)
+        keep = (names != "") & (teams != "")
+        if team_filter:
+            keep &= teams.isin(team_filter)
+        frame, names, teams = frame[keep], names[keep], teams[keep]
+        if frame.empty:
+            return []
+
+        stat_keys = tuple(stat_map)
+        stat_columns = [
+            [round(float(value), 3) for value in pd.to_numeric(frame[col], errors="coerce").tolist()]
+            if col
+            else [0.0] * len(frame)
+            for col in stat_map.values()
+        ]
+        roster_ids_by_team = team_roster_player_ids or {}
+
         cards: list[PlayerCardResponse] = []
-        for row in baselines_df.to_dict("records"):
-            player_id = int(row.get(id_col, 0) or 0)
-            if not player_id:
-                continue
-            player_name = str(row.get(name_col, "")).strip()
-            team = (
-                (roster_team_by_player_id or {}).get(player_id)
-                or str(row.get(team_col, "")).strip().upper()
-            )
-            if team_filter and team not in team_filter:
-                continue
-            roster_ids = (team_roster_player_ids or {}).get(team)
+        for raw_id, player_name, team, *stat_values in zip(
+            frame[id_col].tolist(),
+            names.tolist(),
+            teams.tolist(),
+            *stat_columns,
+        ):
+            player_id = int(raw_id)
+            roster_ids = roster_ids_by_team.get(team)
             if roster_ids is not None and player_id not in roster_ids:
                 continue
-            if not player_name or not team:
-                continue
-
-            position_group = player_positions.get(player_id, [PositionGroup.guards])[0]
-            values = {}
-            for key, col in stat_map.items():
-                raw = row.get(col, 0.0) if col else 0.0
-                values[key] = round(float(raw or 0.0), 3)
 
             cards.append(
                 PlayerCardResponse(
                     player_id=player_id,
                     player_name=player_name,
-                    team=team,
+                    team=self._canonical_abbr(team),
                     season=season,
                     as_of_date=as_of_date,
                     window=window,
-                    position_group=position_group,
-                    mpg=values["mpg"],
-                    ppg=values["ppg"],
-                    assists_pg=values["assists_pg"],
-                    rebounds_pg=values["rebounds_pg"],
-                    steals_pg=values["steals_pg"],
-                    blocks_pg=values["blocks_pg"],
-                    three_pa_pg=values["three_pa_pg"],
-                    three_pm_pg=values["three_pm_pg"],
-                    fta_pg=values["fta_pg"],
-                    ftm_pg=values["ftm_pg"],
-                    fg_pct=values["fg_pct"],
-                    three_p_pct=values["three_p_pct"],
-                    ft_pct=values["ft_pct"],
-                    turnovers_pg=values["turnovers_pg"],
-                    plus_minus_pg=values["plus_minus_pg"],
+                    position_group=player_positions.get(player_id, [PositionGroup.guards])[0],
+                    **dict(zip(stat_keys, stat_values)),
                 )
             )
 
@@ -874,13 +1054,12 @@ class NBADataService:
         if not game_id_col or not team_col or not date_col:
             return set()
 
-        frame = team_logs_df[[game_id_col, team_col, date_col]].copy()
-        frame[team_col] = frame[team_col].astype(str).str.upper()
-        frame = frame[frame[team_col] == team_abbr.upper()]
+        teams = team_logs_df[team_col].astype(str).str.upper()
+        frame = team_logs_df.loc[teams == team_abbr.upper(), [game_id_col, date_col]]
         if frame.empty:
             return set()
 
-        frame["_parsed_date"] = pd.to_datetime(frame[date_col], errors="coerce")
+        frame = frame.assign(_parsed_date=self._parsed_dates(frame[date_col]))
         frame = frame[frame["_parsed_date"].notna()]
         if frame.empty:
             return set()
@@ -893,8 +1072,7 @@ class NBADataService:
         game_id_col = self._pick_column(player_logs_df, ["GAME_ID"])
         if not game_id_col:
             return pd.DataFrame()
-        frame = player_logs_df.copy()
-        frame[game_id_col] = frame[game_id_col].astype(str)
+        frame = player_logs_df.assign(**{game_id_col: player_logs_df[game_id_col].astype(str)})
         return frame[frame[game_id_col].isin(game_ids)]
 
     def _limit_player_logs_to_recent_games(self, player_logs_df: pd.DataFrame, count: int) -> pd.DataFrame:
@@ -907,8 +1085,7 @@ class NBADataService:
         if not player_id_col or not date_col:
             return pd.DataFrame()
 
-        frame = player_logs_df.copy()
-        frame["_parsed_date"] = pd.to_datetime(frame[date_col], errors="coerce")
+        frame = player_logs_df.assign(_parsed_date=self._parsed_dates(player_logs_df[date_col]))
         frame = frame[frame["_parsed_date"].notna()]
         if frame.empty:
             return pd.DataFrame()
@@ -920,7 +1097,7 @@ class NBADataService:
             ascending.append(False)
         frame = frame.sort_values(by=sort_cols, ascending=ascending)
         frame["_rank"] = frame.groupby(player_id_col).cumcount()
-        frame = frame[frame["_rank"] < count].copy()
+        frame = frame[frame["_rank"] < count]
         return frame.drop(columns=["_parsed_date", "_rank"])
 
     def _build_rotation_pool(
@@ -964,13 +1141,20 @@ class NBADataService:
         player_positions: dict[int, list[PositionGroup]] = {}
         inferred_position_count = 0
         fallback_position_count = 0
+        inferred_positions = self._infer_position_groups_bulk(
+            baselines_df,
+            height_inches_col=height_inches_col,
+            height_col=height_col,
+            ast_col=ast_col,
+            reb_col=reb_col,
+        )
 
-        for row in baselines_df.to_dict("records"):
+        for row, profile_positions in zip(baselines_df.to_dict("records"), inferred_positions):
             player_id = int(row.get(player_id_col, 0) or 0)
             player_name = str(row.get(player_name_col, "")).strip()
             team = (
                 (roster_team_by_player_id or {}).get(player_id)
-                or str(row.get(team_col, "")).strip().upper()
+                or self._canonical_abbr(str(row.get(team_col, "")).strip())
             )
             if team_filter and team not in team_filter:
                 continue
@@ -984,16 +1168,7 @@ class NBADataService:
             if not positions:
                 positions = roster_positions.get(player_id, [])
             if not positions:
-                height_inches = row.get(height_inches_col) if height_inches_col else None
-                height_text = row.get(height_col) if height_col else None
-                ast_value = row.get(ast_col) if ast_col else None
-                reb_value = row.get(reb_col) if reb_col else None
-                positions = self._infer_position_groups(
-                    height_inches=height_inches,
-                    height_text=height_text,
-                    ast_value=ast_value,
-                    reb_value=reb_value,
-                )
+                positions = list(profile_positions)
                 if positions:
                     inferred_position_count += 1
 
@@ -1010,6 +1185,8 @@ class NBADataService:
                 continue
 
             player_positions[player_id] = positions
+            # Snapshots stay cached for the whole slate; interned team codes are shared across all rows.
+            team = sys.intern(team)
             for position_group in positions:
                 rotation_pool.append(
                     {
@@ -1035,16 +1212,6 @@ class NBADataService:
 
         return rotation_pool, player_positions
 
-    @staticmethod
-    def _build_roster_team_by_player_id(team_roster_player_ids: dict[str, set[int]] | None) -> dict[int, str]:
-        if not team_roster_player_ids:
-            return {}
-        roster_team_by_player_id: dict[int, str] = {}
-        for team_abbr, player_ids in team_roster_player_ids.items():
-            for player_id in player_ids:
-                roster_team_by_player_id[int(player_id)] = team_abbr
-        return roster_team_by_player_id
-
     def _build_player_minutes_map(self, player_logs_df: pd.DataFrame) -> dict[int, float]:
         if player_logs_df.empty:
             return {}
@@ -1054,43 +1221,24 @@ class NBADataService:
         if not player_id_col or not min_col:
             return {}
 
-        frame = player_logs_df[[player_id_col, min_col]].copy()
-        frame[min_col] = pd.to_numeric(frame[min_col], errors="coerce")
-        frame = frame.dropna(subset=[min_col])
-        if frame.empty:
+        minutes = pd.to_numeric(player_logs_df[min_col], errors="coerce").to_numpy(dtype=float)
+        player_ids = pd.to_numeric(player_logs_df[player_id_col], errors="coerce").to_numpy(dtype=float)
+        mask = ~(np.isnan(minutes) | np.isnan(player_ids))
+        if not mask.any():
             return {}
 
-        grouped = frame.groupby(player_id_col)[min_col].mean()
-        return {int(player_id): float(minutes) for player_id, minutes in grouped.items()}
-
-    def _build_roster_position_map(
-        self,
-        season: str,
-        team_abbr_filter: set[str] | None = None,
-    ) -> dict[int, list[PositionGroup]]:
-        if not self._enable_roster_fetch:
-            return {}
-
-        team_ids: list[int]
-        if team_abbr_filter:
-            team_ids = [self.abbr_to_id[abbr] for abbr in sorted(team_abbr_filter) if abbr in self.abbr_to_id]
-        else:
-            team_ids = [int(team["id"]) for team in self._teams]
-        self._ensure_roster_cache(season=season, team_ids=team_ids)
-
-        result: dict[int, list[PositionGroup]] = {}
-        for team_id in team_ids:
-            positions = self._roster_position_cache.get((season, team_id), {})
-            result.update(positions)
-        return result
+        # Dense player codes let bincount produce per-player sums and counts in two C passes.
+        codes, unique_ids = pd.factorize(player_ids[mask].astype(np.int64))
+        means = np.bincount(codes, weights=minutes[mask]) / np.bincount(codes)
+        return dict(zip(unique_ids.tolist(), means.tolist()))
 
-    def _build_team_roster_player_id_map(
+    def _build_roster_maps(
         self,
         season: str,
         team_abbr_filter: set[str] | None = None,
-    ) -> dict[str, set[int]]:
+    ) -> tuple[dict[int, list[PositionGroup]], dict[str, set[int]], dict[int, str]]:
         if not self._enable_roster_fetch:
-            return {}
+            return {}, {}, {}
 
         team_ids: list[int]
         if team_abbr_filter:
@@ -1099,13 +1247,19 @@ class NBADataService:
             team_ids = [int(team["id"]) for team in self._teams]
         self._ensure_roster_cache(season=season, team_ids=team_ids)
 
-        result: dict[str, set[int]] = {}
+        # One walk over the cached rosters emits positions, per-team ids, and the reverse team lookup.
+        positions: dict[int, list[PositionGroup]] = {}
+        player_ids_by_team: dict[str, set[int]] = {}
+        team_by_player_id: dict[int, str] = {}
         for team_id in team_ids:
+            positions.update(self._roster_position_cache.get((season, team_id), {}))
             player_ids = self._roster_player_ids_cache.get((season, team_id))
             team_abbr = self.id_to_abbr.get(team_id)
             if team_abbr and player_ids:
-                result[team_abbr] = set(player_ids)
-        return result
+                player_ids_by_team[team_abbr] = set(player_ids)
+                for player_id in player_ids:
+                    team_by_player_id[int(player_id)] = team_abbr
+        return positions, player_ids_by_team, team_by_player_id
 
     def _ensure_roster_cache(self, season: str, team_ids: list[int]) -> None:
         if not team_ids:
@@ -1177,58 +1331,53 @@ class NBADataService:
         return team_player_positions, team_player_ids
 
     @staticmethod
-    def _infer_position_groups(
-        height_inches: object | None,
-        height_text: object | None,
-        ast_value: object | None,
-        reb_value: object | None,
-    ) -> list[PositionGroup]:
-        parsed_height = NBADataService._parse_height_inches(height_inches, height_text)
-        if parsed_height is not None:
-            if parsed_height <= 77:
-                return [PositionGroup.guards]
-            if parsed_height >= 82:
-                return [PositionGroup.centers]
-            return [PositionGroup.forwards]
-
-        ast_num = NBADataService._safe_float(ast_value)
-        reb_num = NBADataService._safe_float(reb_value)
-        if ast_num is None and reb_num is None:
-            return []
-
-        # Guard-forward split fallback when no roster/position metadata is available.
-        if ast_num is not None and ast_num >= 4.0:
-            return [PositionGroup.guards]
-        if reb_num is not None and reb_num >= 7.0:
-            return [PositionGroup.centers]
-        return [PositionGroup.forwards]
-
-    @staticmethod
-    def _parse_height_inches(height_inches: object | None, height_text: object | None) -> int | None:
-        numeric = NBADataService._safe_float(height_inches)
-        if numeric is not None:
-            return int(round(numeric))
-
-        if isinstance(height_text, str):
-            text = height_text.strip()
-            if "-" in text:
-                parts = text.split("-")
-                if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-                    feet = int(parts[0])
-                    inches = int(parts[1])
-                    return (feet * 12) + inches
-            if text.isdigit():
-                return int(text)
-        return None
-
-    @staticmethod
-    def _safe_float(value: object | None) -> float | None:
-        try:
-            if value is None:
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+    def _infer_position_groups_bulk(
+        frame: pd.DataFrame,
+        height_inches_col: str | None,
+        height_col: str | None,
+        ast_col: str | None,
+        reb_col: str | None,
+    ) -> list[tuple[PositionGroup, ...]]:
+        # Height buckets first (<=77in guards, >=82in centers, otherwise forwards), then an AST/REB profile
+        # as the guard-forward split fallback when no roster/position metadata is available.
+        row_count = len(frame)
+        heights = np.full(row_count, np.nan)
+        if height_inches_col:
+            heights = pd.to_numeric(frame[height_inches_col], errors="coerce").round().to_numpy(dtype=float)
+        if height_col and frame[height_col].dtype == object:
+            # .str yields NaN for non-string cells, so only text heights ("6-11" or "83") are parsed.
+            text = frame[height_col].str.strip()
+            feet_inches = text.str.extract(r"^(\d+)-(\d+)$").astype(float)
+            from_text = (feet_inches[0] * 12 + feet_inches[1]).fillna(
+                pd.to_numeric(text.where(text.str.fullmatch(r"\d+", na=False)), errors="coerce")
+            )
+            heights = np.where(np.isnan(heights), from_text.to_numpy(dtype=float), heights)
+
+        def stat_values(column: str | None) -> tuple[np.ndarray, np.ndarray]:
+            if not column:
+                return np.full(row_count, np.nan), np.zeros(row_count, dtype=bool)
+            numeric = pd.to_numeric(frame[column], errors="coerce")
+            # NaN floats still count as a value; only unparseable cells are missing.
+            present = np.ones(row_count, dtype=bool) if frame[column].dtype.kind == "f" else numeric.notna().to_numpy()
+            return numeric.to_numpy(dtype=float), present
+
+        ast, has_ast = stat_values(ast_col)
+        reb, has_reb = stat_values(reb_col)
+        has_height = ~np.isnan(heights)
+        groups = np.select(
+            [
+                has_height & (heights <= 77),
+                has_height & (heights >= 82),
+                has_height,
+                ~has_ast & ~has_reb,
+                has_ast & (ast >= 4.0),
+                has_reb & (reb >= 7.0),
+            ],
+            [0, 2, 1, -1, 0, 2],
+            default=1,
+        )
+        choices = ((), (PositionGroup.guards,), (PositionGroup.forwards,), (PositionGroup.centers,))
+        return [choices[code + 1] for code in groups.tolist()]
 
     def _build_team_last10_game_ids(self, team_logs_df: pd.DataFrame) -> dict[str, set[str]]:
         if team_logs_df.empty:
@@ -1241,14 +1390,21 @@ class NBADataService:
         if not all([team_col, game_id_col, date_col]):
             return defaultdict(set)
 
-        frame = team_logs_df[[team_col, game_id_col, date_col]].copy()
-        frame["_parsed_date"] = pd.to_datetime(frame[date_col], errors="coerce")
+        frame = team_logs_df[[team_col, game_id_col, date_col]].assign(
+            _parsed_date=self._parsed_dates(team_logs_df[date_col])
+        )
         frame = frame.dropna(subset=["_parsed_date"])
 
+        # One global date sort, then the first ten rows per team, instead of a sort per team group.
+        recent = (
+            frame.sort_values("_parsed_date", ascending=False, kind="stable")
+            .groupby(team_col, sort=False, observed=True)
+            .head(10)
+        )
+
         result: dict[str, set[str]] = defaultdict(set)
-        for team, subset in frame.groupby(team_col):
-            sorted_subset = subset.sort_values("_parsed_date", ascending=False).head(10)
-            result[str(team).upper()] = {str(game_id) for game_id in sorted_subset[game_id_col].astype(str).tolist()}
+        for team, game_id in zip(recent[team_col].tolist(), recent[game_id_col].astype(str).tolist()):
+            result[str(team).upper()].add(game_id)
 
         return result
 
@@ -1257,72 +1413,55 @@ class NBADataService:
             return {}, {}
 
         required = ["GAME_ID", "TEAM_ABBREVIATION", "GAME_DATE", "FGA", "FTA", "OREB", "TOV", "PTS"]
-        present = {col.upper(): col for col in team_logs_df.columns}
+        present = _upper_column_lookup(tuple(team_logs_df.columns))
         if not all(column in present for column in required):
             return {}, {}
 
-        team_logs_df = team_logs_df.copy()
-        team_logs_df["_parsed_date"] = pd.to_datetime(team_logs_df[present["GAME_DATE"]], errors="coerce")
+        team_logs_df = team_logs_df.assign(_parsed_date=self._parsed_dates(team_logs_df[present["GAME_DATE"]]))
         team_logs_df = team_logs_df.dropna(subset=["_parsed_date"])
 
-        game_col = present["GAME_ID"]
-        team_col = present["TEAM_ABBREVIATION"]
-        fga_col = present["FGA"]
-        fta_col = present["FTA"]
-        oreb_col = present["OREB"]
-        tov_col = present["TOV"]
-        pts_col = present["PTS"]
-
-        by_game: dict[str, list[dict]] = defaultdict(list)
-        records = team_logs_df.to_dict("records")
-        for row in records:
-            by_game[str(row[game_col])].append(row)
-
-        per_team_games: dict[str, list[dict]] = defaultdict(list)
-
-        for row in records:
-            game_id = str(row[game_col])
-            team = str(row[team_col]).upper()
-            date_value = row["_parsed_date"]
-            opponents = [candidate for candidate in by_game[game_id] if str(candidate[team_col]).upper() != team]
-            if not opponents:
-                continue
-
-            opp = opponents[0]
-            team_poss = float(row[fga_col]) + 0.44 * float(row[fta_col]) - float(row[oreb_col]) + float(row[tov_col])
-            opp_poss = float(opp[fga_col]) + 0.44 * float(opp[fta_col]) - float(opp[oreb_col]) + float(opp[tov_col])
-            possessions = 0.5 * (team_poss + opp_poss)
-            if possessions <= 0:
-                continue
-
-            def_rating = (float(opp[pts_col]) / possessions) * 100.0
-            per_team_games[team].append(
-                {
-                    "game_id": game_id,
-                    "date": date_value,
-                    "def_rating": def_rating,
-                    "pace": possessions,
-                }
-            )
-
-        season_metrics: dict[str, dict[str, float]] = {}
-        last10_metrics: dict[str, dict[str, float]] = {}
-
-        for team, rows in per_team_games.items():
-            if not rows:
-                continue
-            sorted_rows = sorted(rows, key=lambda item: item["date"], reverse=True)
-
-            season_def = sum(row["def_rating"] for row in sorted_rows) / len(sorted_rows)
-            season_pace = sum(row["pace"] for row in sorted_rows) / len(sorted_rows)
-            season_metrics[team] = {"def_rating": season_def, "pace": season_pace}
+        def numeric(column: str) -> np.ndarray:
+            return pd.to_numeric(team_logs_df[present[column]], errors="coerce").to_numpy(dtype=float)
+
+        frame = pd.DataFrame(
+            {
+                "game_id": team_logs_df[present["GAME_ID"]].astype(str).to_numpy(),
+                "team": team_logs_df[present["TEAM_ABBREVIATION"]].astype(str).str.upper().to_numpy(),
+                "date": team_logs_df["_parsed_date"].to_numpy(),
+                "poss": numeric("FGA") + 0.44 * numeric("FTA") - numeric("OREB") + numeric("TOV"),
+                "pts": numeric("PTS"),
+                "row": np.arange(len(team_logs_df)),
+            }
+        )
+        # Pair every team row with the first other-team row of the same game.
+        pairs = frame.merge(frame[["game_id", "team", "poss", "pts", "row"]], on="game_id", suffixes=("", "_opp"))
+        pairs = pairs[pairs["team"] != pairs["team_opp"]]
+        pairs = pairs.sort_values(["row", "row_opp"]).drop_duplicates("row")
+        possessions = 0.5 * (pairs["poss"] + pairs["poss_opp"])
+        pairs = pairs.assign(pace=possessions, def_rating=(pairs["pts_opp"] / possessions) * 100.0)
+        pairs = pairs[~(possessions <= 0)]
+        if pairs.empty:
+            return {}, {}
 
-            recent = sorted_rows[:10]
-            last10_def = sum(row["def_rating"] for row in recent) / len(recent)
-            last10_pace = sum(row["pace"] for row in recent) / len(recent)
-            last10_metrics[team] = {"def_rating": last10_def, "pace": last10_pace}
+        team_codes, teams = pd.factorize(pairs["team"])
+        pairs = pairs.assign(team_code=team_codes).sort_values("date", ascending=False, kind="stable")
+        team_codes = pairs["team_code"].to_numpy()
+        recent = (pairs.groupby("team_code", sort=False).cumcount() < 10).to_numpy()
+
+        def team_means(mask: np.ndarray) -> dict[str, dict[str, float]]:
+            counts = np.bincount(team_codes[mask], minlength=len(teams))
+            means = {
+                metric: (
+                    np.bincount(team_codes[mask], weights=pairs[metric].to_numpy()[mask], minlength=len(teams)) / counts
+                ).tolist()
+                for metric in ("def_rating", "pace")
+            }
+            return {
+                team: {"def_rating": means["def_rating"][index], "pace": means["pace"][index]}
+                for index, team in enumerate(teams.tolist())
+            }
 
-        return season_metrics, last10_metrics
+        return team_means(np.ones(len(pairs), dtype=bool)), team_means(recent)
 
     def _build_dvp_tables(
         self,
@@ -1344,49 +1483,92 @@ class NBADataService:
         if not all(stat_cols.values()):
             return {}, {}
 
-        season_game_totals = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(float))))
-        last10_game_totals = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(float))))
-
-        for row in player_logs.to_dict("records"):
-            player_id = int(row.get(player_id_col, 0) or 0)
-            groups = player_positions.get(player_id)
-            if not groups:
-                continue
+        player_ids = pd.to_numeric(player_logs[player_id_col], errors="coerce").fillna(0).astype(np.int64)
+        # A season has a few hundred distinct MATCHUP strings: parse each once and gather by code.
+        # The trailing None is what missing matchups (factorize code -1) resolve to.
+        matchup_codes, unique_matchups = pd.factorize(player_logs[matchup_col])
+        unique_opponents = np.array(
+            [parse_matchup_opponent(str(matchup)) for matchup in unique_matchups] + [None],
+            dtype=object,
+        )
+        rows = pd.DataFrame(
+            {
+                "opponent": unique_opponents[matchup_codes],
+                "game_id": player_logs[game_id_col].astype(str).to_numpy(),
+                "group": player_ids.map(player_positions).to_numpy(),
+            }
+        )
+        rows = rows[rows["opponent"].astype(bool) & (rows["game_id"] != "") & rows["group"].notna()]
+        # One entry per (log row, position group); the index still points at the source row.
+        rows = rows.explode("group").dropna(subset=["group"])
+        if rows.empty:
+            return {}, {}
 
-            opponent = parse_matchup_opponent(str(row.get(matchup_col) or ""))
-            if not opponent:
-                continue
+        values = np.column_stack([self._float_array(player_logs[stat_col]) for stat_col in stat_cols.values()])
+        values = values[rows.index.to_numpy()]
+        opponent_codes, opponents = pd.factorize(rows["opponent"])
+        group_codes, groups = pd.factorize(rows["group"])
+        game_codes, game_ids = pd.factorize(rows["game_id"])
+
+        # Encode each team's last-10 games with the same (opponent, game) codes as the rows
+        # so membership is a single isin instead of a per-row set lookup.
+        last10_pairs = [(team, game_id) for team, games in team_last10_games.items() for game_id in games]
+        last10_opponents = opponents.get_indexer([team for team, _ in last10_pairs])
+        last10_games = game_ids.get_indexer([game_id for _, game_id in last10_pairs])
+        known = (last10_opponents >= 0) & (last10_games >= 0)
+        in_last10 = np.isin(
+            opponent_codes * len(game_ids) + game_codes,
+            last10_opponents[known] * len(game_ids) + last10_games[known],
+        )
 
-            game_id = str(row.get(game_id_col, ""))
-            if not game_id:
-                continue
+        cells = (opponent_codes, group_codes, game_codes)
+        season_stats = self._average_team_group_stats(cells, values, opponents, groups, len(game_ids))
+        last10_stats = self._average_team_group_stats(
+            tuple(codes[in_last10] for codes in cells),
+            values[in_last10],
+            opponents,
+            groups,
+            len(game_ids),
+        )
+        return season_stats, last10_stats
 
-            for group in groups:
-                for stat, stat_col in stat_cols.items():
-                    value = float(row.get(stat_col, 0.0) or 0.0)
-                    season_game_totals[opponent][group][game_id][stat] += value
-                    if game_id in team_last10_games.get(opponent, set()):
-                        last10_game_totals[opponent][group][game_id][stat] += value
+    @staticmethod
+    def _float_array(values: pd.Series) -> np.ndarray:
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            return values.to_numpy(dtype=float)
+        return np.array([float(value or 0.0) for value in values.tolist()], dtype=float)
 
-        season_stats = self._average_team_group_stats(season_game_totals)
-        last10_stats = self._average_team_group_stats(last10_game_totals)
-        return season_stats, last10_stats
+    @staticmethod
+    def _average_team_group_stats(
+        cells: tuple[np.ndarray, np.ndarray, np.ndarray],
+        values: np.ndarray,
+        opponents: pd.Index,
+        groups: pd.Index,
+        game_count: int,
+    ) -> dict:
+        # Per (opponent, group) cell: stat totals summed over every row, divided by distinct games seen.
+        opponent_codes, group_codes, game_codes = cells
+        cell_count = len(opponents) * len(groups)
+        cell_ids = opponent_codes * len(groups) + group_codes
+        games_per_cell = np.bincount(
+            np.unique(cell_ids * game_count + game_codes) // game_count,
+            minlength=cell_count,
+        )
+        totals = np.column_stack(
+            [np.bincount(cell_ids, weights=values[:, index], minlength=cell_count) for index in range(values.shape[1])]
+        )
 
-    def _average_team_group_stats(self, game_totals: dict) -> dict:
         result = defaultdict(lambda: defaultdict(dict))
-        for team, group_map in game_totals.items():
-            for group, game_map in group_map.items():
-                games_count = len(game_map)
-                if games_count == 0:
-                    continue
-                for stat in SUPPORTED_STATS:
-                    total = sum(float(values.get(stat, 0.0)) for values in game_map.values())
-                    result[team][group][stat] = round(total / games_count, 3)
+        for cell_id in np.flatnonzero(games_per_cell).tolist():
+            averages = (totals[cell_id] / games_per_cell[cell_id]).tolist()
+            team_stats = result[opponents[cell_id // len(groups)]][groups[cell_id % len(groups)]]
+            for stat, average in zip(SUPPORTED_STATS, averages):
+                team_stats[stat] = round(average, 3)
         return result
 
     @staticmethod
     def _pick_column(df: pd.DataFrame, names: Iterable[str]) -> str | None:
-        columns = {column.upper(): column for column in df.columns}
+        columns = _upper_column_lookup(tuple(df.columns))
         for name in names:
             if name.upper() in columns:
                 return columns[name.upper()]
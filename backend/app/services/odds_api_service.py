@@ -5,6 +5,7 @@ import os
 from typing import Any
 
 import httpx
+import orjson
 
 from app.models import Game, GameLine
 
@@ -67,11 +68,27 @@ class OddsAPIService:
                 timeout_seconds=float(os.getenv("THE_ODDS_TIMEOUT_SECONDS", "8.0")),
             )
         self._config = config
+        # Created on first use so unconfigured deployments never open a pool; reused for keep-alive after.
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._config.timeout_seconds,
+                http2=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch_game_lines(self, games: list[Game]) -> list[GameLine]:
         if not self._config.api_key:
             return [
-                GameLine(
+                GameLine.model_construct(
                     game_id=game.game_id,
                     away_team=game.away_team,
                     home_team=game.home_team,
@@ -95,7 +112,7 @@ class OddsAPIService:
             event = by_matchup.get((away_name, home_name))
             if not event:
                 lines.append(
-                    GameLine(
+                    GameLine.model_construct(
                         game_id=game.game_id,
                         away_team=game.away_team,
                         home_team=game.home_team,
@@ -106,7 +123,7 @@ class OddsAPIService:
 
             away_spread, home_spread, game_total = self._extract_market_lines(event)
             lines.append(
-                GameLine(
+                GameLine.model_construct(
                     game_id=game.game_id,
                     away_team=game.away_team,
                     home_team=game.home_team,
@@ -128,10 +145,9 @@ class OddsAPIService:
             "oddsFormat": self._config.odds_format,
             "dateFormat": self._config.date_format,
         }
-        async with httpx.AsyncClient(timeout=self._config.timeout_seconds) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
+        response = await self._get_client().get(url, params=params)
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
         if not isinstance(payload, list):
             return []
         return [item for item in payload if isinstance(item, dict)]
@@ -155,6 +171,8 @@ class OddsAPIService:
                 continue
 
             for market in markets:
+                if away_spread is not None and home_spread is not None and game_total is not None:
+                    break
                 if not isinstance(market, dict):
                     continue
                 key = str(market.get("key", "")).strip().lower()
@@ -174,6 +192,8 @@ class OddsAPIService:
                             away_spread = point
                         elif name == home_name:
                             home_spread = point
+                        if away_spread is not None and home_spread is not None:
+                            break
 
                 if key == "totals" and game_total is None:
                     for outcome in outcomes:
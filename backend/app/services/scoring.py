@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable
+
+import numpy as np
 
 from app.models import PositionGroup
 from app.utils import SUPPORTED_STATS, normalize_score
@@ -17,17 +19,29 @@ def build_rank_tables(
     ranks: TeamGroupRank = defaultdict(lambda: defaultdict(dict))
 
     groups = [PositionGroup.guards, PositionGroup.forwards, PositionGroup.centers]
+    teams = list(teams)
+    if not teams:
+        return ranks
 
-    for group in groups:
-        for stat in SUPPORTED_STATS:
-            values: list[Tuple[str, float]] = []
-            for team in teams:
-                value = team_group_stats.get(team, {}).get(group, {}).get(stat, 0.0)
-                values.append((team, value))
+    values = np.zeros((len(teams), len(groups), len(SUPPORTED_STATS)))
+    for team_index, team in enumerate(teams):
+        group_stats = team_group_stats.get(team)
+        if not group_stats:
+            continue
+        for group_index, group in enumerate(groups):
+            stats = group_stats.get(group)
+            if stats:
+                values[team_index, group_index] = [stats.get(stat, 0.0) for stat in SUPPORTED_STATS]
+    # A stable sort on the negated values ranks every (group, stat) column at once and keeps
+    # tied teams in input order, matching the old per-column reverse sort.
+    order = np.argsort(-values, axis=0, kind="stable")
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(1, len(teams) + 1)[:, None, None], axis=0)
 
-            values.sort(key=lambda item: item[1], reverse=True)
-            for index, (team, _) in enumerate(values, start=1):
-                ranks[team][group][stat] = index
+    for team_index in order[:, 0, 0].tolist():
+        team_ranks = ranks[teams[team_index]]
+        for group, group_positions in zip(groups, positions[team_index].tolist()):
+            team_ranks[group] = dict(zip(SUPPORTED_STATS, group_positions))
 
     return ranks
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, date
-import json
 from pathlib import Path
 import sqlite3
 import threading
@@ -42,13 +41,15 @@ class SnapshotStore:
 
         payload_raw = row[0]
         try:
-            payload = json.loads(payload_raw) if isinstance(payload_raw, str) else payload_raw
-            return MatchupResponse.model_validate(payload)
+            # SQLite hands back the stored text; Postgres jsonb columns arrive already decoded.
+            if isinstance(payload_raw, (str, bytes)):
+                return MatchupResponse.model_validate_json(payload_raw)
+            return MatchupResponse.model_validate(payload_raw)
         except Exception:
             return None
 
     def upsert(self, matchup_response: MatchupResponse) -> None:
-        payload = json.dumps(matchup_response.model_dump(mode="json"))
+        payload = matchup_response.model_dump_json()
         now = datetime.now(UTC).isoformat()
         if self._backend.startswith("sqlite"):
             self._sqlite_upsert_snapshot(
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 import os
 from typing import Any, Iterable
 
 import httpx
+import orjson
 
 from app.models import Game, GameLine
 
@@ -74,7 +74,7 @@ class SportsMCPService:
     async def fetch_game_lines(self, games: list[Game]) -> list[GameLine]:
         if not self._config.url or not games:
             return [
-                GameLine(
+                GameLine.model_construct(
                     game_id=game.game_id,
                     away_team=game.away_team,
                     home_team=game.home_team,
@@ -86,7 +86,7 @@ class SportsMCPService:
         events = await self._fetch_competition_events()
         if not events:
             return [
-                GameLine(
+                GameLine.model_construct(
                     game_id=game.game_id,
                     away_team=game.away_team,
                     home_team=game.home_team,
@@ -163,7 +163,7 @@ class SportsMCPService:
                 }
                 response = await client.post(self._config.url, json=payload)
                 response.raise_for_status()
-                body = response.json()
+                body = orjson.loads(response.content)
                 for event in self._extract_events(body):
                     event_key = str(
                         event.get("id")
@@ -181,7 +181,7 @@ class SportsMCPService:
     def _line_from_event(self, game: Game, events: list[dict[str, Any]]) -> GameLine:
         event = self._match_event(game, events)
         if not event:
-            return GameLine(
+            return GameLine.model_construct(
                 game_id=game.game_id,
                 away_team=game.away_team,
                 home_team=game.home_team,
@@ -189,7 +189,7 @@ class SportsMCPService:
             )
 
         away_spread, home_spread, game_total = self._extract_market_lines(event)
-        return GameLine(
+        return GameLine.model_construct(
             game_id=game.game_id,
             away_team=game.away_team,
             home_team=game.home_team,
@@ -344,7 +344,7 @@ class SportsMCPService:
                             text = item.get("text")
                             if isinstance(text, str):
                                 try:
-                                    queue.append(json.loads(text))
+                                    queue.append(orjson.loads(text))
                                 except Exception:
                                     continue
                 for value in node.values():
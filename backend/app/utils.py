@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from app.models import MatchupTier, PositionGroup
@@ -15,6 +16,7 @@ DISPLAY_STATS = {
     "STL": "STL",
     "BLK": "BLK",
 }
+DISPLAY_STAT_PAIRS = tuple((stat_key, DISPLAY_STATS[stat_key]) for stat_key in SUPPORTED_STATS)
 
 
 def now_et() -> datetime:
@@ -25,6 +27,7 @@ def current_et_date() -> date:
     return now_et().date()
 
 
+@lru_cache(maxsize=1024)
 def season_label_for_date(target_date: date) -> str:
     year = target_date.year
     if target_date.month >= 10:
@@ -35,6 +38,7 @@ def season_label_for_date(target_date: date) -> str:
     return f"{start_year}-{end_year_short}"
 
 
+@lru_cache(maxsize=1024)
 def season_bounds_for_label(season_label: str) -> tuple[date, date]:
     start_year = int(season_label.split("-")[0])
     return date(start_year, 10, 1), date(start_year + 1, 6, 30)
@@ -42,6 +46,7 @@ def season_bounds_for_label(season_label: str) -> tuple[date, date]:
 
 def as_of_date_for_slate(slate_date: date) -> date:
     # Use same-day data when available, while preventing future as-of dates.
+    # Not memoized: the result depends on the current ET date, not just the argument.
     return min(slate_date, current_et_date())
 
 
@@ -71,6 +76,7 @@ def map_position_groups(position: str | None) -> list[PositionGroup]:
     return groups
 
 
+@lru_cache(maxsize=4096)
 def parse_matchup_opponent(matchup: str | None) -> str | None:
     if not matchup:
         return None
@@ -93,6 +99,10 @@ def to_tier(rank: int) -> MatchupTier:
     return MatchupTier.red
 
 
+# Ranks run 1..30 (one per team), so tiers are looked up by index instead of re-running to_tier.
+TIERS_BY_RANK = tuple(to_tier(rank) for rank in range(31))
+
+
 def normalize_score(value: float, min_value: float, max_value: float) -> float:
     if max_value <= min_value:
         return 50.0
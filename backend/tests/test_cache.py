@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import queue
 import tempfile
 import unittest
 from pathlib import Path
@@ -10,17 +12,18 @@ from app.services.cache import InMemoryCache
 class InMemoryCacheTests(unittest.TestCase):
     def test_persists_entries_across_instances(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
-            cache_file = Path(tmp) / "cache.pkl"
+            cache_file = Path(tmp) / "cache.db"
 
             cache_a = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
             cache_a.set("alpha", {"value": 1})
+            cache_a.flush()
 
             cache_b = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
             self.assertEqual(cache_b.get("alpha"), {"value": 1})
 
     def test_invalidate_prefix_persists_removal(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
-            cache_file = Path(tmp) / "cache.pkl"
+            cache_file = Path(tmp) / "cache.db"
 
             cache_a = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
             cache_a.set("matchups:2026-02-11:season", "x")
@@ -28,11 +31,112 @@ class InMemoryCacheTests(unittest.TestCase):
 
             removed = cache_a.invalidate_prefix("matchups:2026-02-11:")
             self.assertEqual(removed, 2)
+            cache_a.flush()
 
             cache_b = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
             self.assertIsNone(cache_b.get("matchups:2026-02-11:season"))
             self.assertIsNone(cache_b.get("matchups:2026-02-11:last10"))
 
+    def test_set_after_invalidate_is_persisted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = Path(tmp) / "cache.db"
+
+            cache_a = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file), flush_delay_seconds=60)
+            cache_a.set("matchups:2026-02-11:season", "old")
+            cache_a.flush()
+            cache_a.invalidate_prefix("matchups:2026-02-11:")
+            cache_a.set("matchups:2026-02-11:season", "new")
+            cache_a.flush()
+
+            cache_b = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
+            self.assertEqual(cache_b.get("matchups:2026-02-11:season"), "new")
+
+    def test_corrupt_cache_file_falls_back_to_memory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = Path(tmp) / "cache.db"
+            cache_file.write_bytes(b"not a sqlite database" * 100)
+
+            cache = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
+            cache.set("alpha", 1)
+            cache.flush()
+            self.assertEqual(cache.get("alpha"), 1)
+
+    def test_writes_are_coalesced_into_a_delayed_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = Path(tmp) / "cache.db"
+
+            cache = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file), flush_delay_seconds=60)
+            cache.set("alpha", 1)
+            cache.set("beta", 2)
+            self.assertIsNone(InMemoryCache(ttl_minutes=30, persist_path=str(cache_file)).get("alpha"))
+
+            cache.flush()
+            reloaded = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
+            self.assertEqual(reloaded.get("alpha"), 1)
+            self.assertEqual(reloaded.get("beta"), 2)
+
+    def test_expired_reads_do_not_schedule_a_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = Path(tmp) / "cache.db"
+
+            cache = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file), flush_delay_seconds=60)
+            cache.set("alpha", 1, ttl_seconds=0)
+            cache.flush()
+            cache._write_requests = queue.Queue(maxsize=1)
+
+            self.assertIsNone(cache.get("alpha"))
+            self.assertTrue(cache._write_requests.empty())
+
+    def test_entries_use_their_own_ttl(self) -> None:
+        cache = InMemoryCache(ttl_minutes=30)
+        cache.set("resp:/meta:2026-02-11", b"{}", ttl_seconds=60)
+        cache.set("resp:/meta:2026-02-10", b"{}", ttl_seconds=0)
+        cache.set("matchups:2026-02-11:season", {"x": 1})
+
+        self.assertEqual(cache.get_typed("resp:/meta:2026-02-11", bytes), b"{}")
+        self.assertIsNone(cache.get_typed("resp:/meta:2026-02-10", bytes))
+        self.assertIsNone(cache.get_typed("matchups:2026-02-11:season", bytes))
+
+    def test_memory_only_entries_are_not_persisted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = Path(tmp) / "cache.db"
+
+            cache = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file), flush_delay_seconds=60)
+            cache.set("resp:/matchups:2026-02-11:season", b"{}", persist=False)
+            cache.set("matchups:2026-02-11:season", {"x": 1})
+            cache.flush()
+            reloaded = InMemoryCache(ttl_minutes=30, persist_path=str(cache_file))
+
+            self.assertEqual(cache.get("resp:/matchups:2026-02-11:season"), b"{}")
+            self.assertIsNone(reloaded.get("resp:/matchups:2026-02-11:season"))
+            self.assertEqual(reloaded.get("matchups:2026-02-11:season"), {"x": 1})
+
+    def test_get_typed_requires_exact_type(self) -> None:
+        cache = InMemoryCache(ttl_minutes=30)
+        cache.set("game-lines:2026-02-11", {"lines": []})
+
+        self.assertEqual(cache.get_typed("game-lines:2026-02-11", dict), {"lines": []})
+        self.assertIsNone(cache.get_typed("game-lines:2026-02-11", list))
+        self.assertIsNone(cache.get_typed("game-lines:2026-02-12", dict))
+
+
+class SingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_misses_share_one_computation(self) -> None:
+        cache = InMemoryCache(ttl_minutes=30)
+        calls = 0
+
+        async def compute() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.single_flight("matchups:2026-02-11:season", compute) for _ in range(10)))
+
+        self.assertEqual(results, ["value"] * 10)
+        self.assertEqual(calls, 1)
+        self.assertEqual(cache._inflight, {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+import gc
+from typing import Mapping
+import unittest
+
+import httpx
+
+from app.models import InjuryTag
+from app.services.injury_service import InjuryService
+
+
+class StubInjuryService(InjuryService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.responses: dict[str, tuple[float, list[str] | Exception]] = {}
+        self.requested_urls: list[str] = []
+
+    async def _fetch_provider_injuries(
+        self,
+        source: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        want_debug: bool = False,
+    ):
+        self.requested_urls.append(url)
+        delay, player_names = self.responses.get(url, (0.0, []))
+        await asyncio.sleep(delay)
+        if isinstance(player_names, Exception):
+            raise player_names
+        injuries = [
+            InjuryTag(player_name=player_name, team="BOS", status="OUT", source=source)
+            for player_name in player_names
+        ]
+        return injuries, {"status_code": 200, "error": None}
+
+
+class InjuryServiceRetryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_stalled_read_is_retried_within_the_sweep_deadline(self) -> None:
+        service = InjuryService(deadline_seconds=0.6)
+        slate_date = date(2026, 2, 11)
+        generic_url = service._provider_urls(slate_date)[2][1]
+        attempts: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) != generic_url:
+                return httpx.Response(404)
+            attempts.append(str(request.url))
+            if len(attempts) == 1:
+                # Stall for the full per-request read budget, as a hung provider would.
+                await asyncio.sleep(request.extensions["timeout"]["read"])
+                raise httpx.ReadTimeout("stalled", request=request)
+            row = {"playerName": "Jayson Tatum", "teamAbbrev": "BOS", "status": "Out"}
+            return httpx.Response(200, json={"injuryReport": {"injuries": [row]}})
+
+        await service.aclose()
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            injuries = await service.fetch_injuries(slate_date)
+        finally:
+            await service.aclose()
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual([injury.player_name for injury in injuries], ["Jayson Tatum"])
+
+
+class InjuryServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.service = StubInjuryService()
+
+    async def asyncTearDown(self) -> None:
+        await self.service.aclose()
+
+    async def test_nba_cdn_urls_are_raced(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        dated_url, generic_url = urls[1], urls[2]
+        self.service.responses = {
+            dated_url: (0.5, ["Dated Player"]),
+            generic_url: (0.01, ["Generic Player"]),
+        }
+
+        injuries = await self.service.fetch_injuries(slate_date)
+
+        self.assertEqual([injury.player_name for injury in injuries], ["Generic Player"])
+        self.assertIn(dated_url, self.service.requested_urls)
+
+    async def test_higher_priority_source_wins(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        self.service.responses = {
+            urls[0]: (0.05, ["ESPN Player"]),
+            urls[2]: (0.0, ["Generic Player"]),
+        }
+
+        injuries = await self.service.fetch_injuries(slate_date)
+
+        self.assertEqual([injury.player_name for injury in injuries], ["ESPN Player"])
+
+    async def test_fallback_sources_are_requested_concurrently(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        self.service.responses = {
+            urls[0]: (0.2, []),
+            urls[2]: (0.2, ["Generic Player"]),
+        }
+
+        started = asyncio.get_running_loop().time()
+        injuries = await self.service.fetch_injuries(slate_date)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        self.assertEqual([injury.player_name for injury in injuries], ["Generic Player"])
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(set(self.service.requested_urls), set(urls))
+
+    async def test_unawaited_provider_failures_are_retrieved(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        self.service.responses = {
+            urls[0]: (0.05, ["ESPN Player"]),
+            urls[1]: (0.0, KeyError("injuryReport")),
+        }
+        unhandled: list[dict] = []
+        asyncio.get_running_loop().set_exception_handler(lambda _, context: unhandled.append(context))
+
+        injuries = await self.service.fetch_injuries(slate_date)
+        await asyncio.sleep(0)
+        gc.collect()
+
+        self.assertEqual([injury.player_name for injury in injuries], ["ESPN Player"])
+        self.assertEqual(unhandled, [])
+
+    async def test_debug_sweep_reports_provider_parser_errors(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        self.service.responses = {urls[0]: (0.0, TypeError("unexpected payload"))}
+
+        result = await self.service.fetch_injuries_debug(slate_date)
+
+        self.assertEqual(len(result["providers"]), len(urls))
+        self.assertEqual(result["providers"][0]["error"], "unexpected payload")
+        self.assertEqual(result["providers"][0]["parsed_injuries"], 0)
+
+    async def test_deadline_serves_last_good_list(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        self.service.responses = {urls[0]: (0.0, ["ESPN Player"])}
+        await self.service.fetch_injuries(slate_date)
+
+        self.service._cache["2026-02-11"] = (0.0, self.service._cache["2026-02-11"][1])
+        self.service._deadline_seconds = 0.05
+        self.service.responses = {urls[0]: (1.0, ["Late Player"])}
+        injuries = await self.service.fetch_injuries(slate_date)
+
+        self.assertEqual([injury.player_name for injury in injuries], ["ESPN Player"])
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.service.fetch_injuries(date(2026, 2, 12))
+
+    async def test_indexed_fetch_reuses_index_until_list_changes(self) -> None:
+        slate_date = date(2026, 2, 11)
+        urls = [url for _, url, _ in self.service._provider_urls(slate_date)]
+        self.service.responses = {urls[0]: (0.0, ["Jayson Tatum"])}
+
+        injuries, index = await self.service.fetch_injuries_indexed(slate_date)
+        _, repeat_index = await self.service.fetch_injuries_indexed(slate_date)
+        self.service._cache["2026-02-11"] = (0.0, injuries)
+        self.service.responses = {urls[0]: (0.0, ["Jaylen Brown"])}
+        _, refreshed_index = await self.service.fetch_injuries_indexed(slate_date)
+
+        self.assertEqual(index, ({"BOS\x1fJAYSON TATUM": "OUT"}, {"JAYSON TATUM": "OUT"}))
+        self.assertIs(repeat_index, index)
+        self.assertEqual(refreshed_index[1], {"JAYLEN BROWN": "OUT"})
+
+    async def test_extract_nba_cdn_rows(self) -> None:
+        payload = {
+            "injuryReport": {
+                "injuries": [
+                    {
+                        "playerName": " Jayson Tatum ",
+                        "teamAbbrev": "bos",
+                        "status": "Out",
+                        "description": "Left ankle sprain",
+                        "lastUpdated": "2026-02-11T17:30:00Z",
+                    },
+                    {"name": "Coby White", "team": "Chicago Bulls", "notes": "Questionable - hamstring"},
+                    {"playerName": "INJURY_STATUS_HEADER", "status": "OUT"},
+                    {"playerName": "No Status", "teamAbbrev": "BOS"},
+                ]
+            }
+        }
+
+        injuries, candidate_rows = self.service._extract_injuries(payload=payload, source="nba-cdn", default_team=None)
+
+        self.assertEqual(
+            [(injury.player_name, injury.team, injury.status) for injury in injuries],
+            [("Jayson Tatum", "BOS", "OUT"), ("Coby White", "CHI", "QUESTIONABLE")],
+        )
+        self.assertEqual(injuries[0].comment, "Left ankle sprain")
+        self.assertIsNotNone(injuries[0].updated_at)
+        self.assertIsNone(injuries[1].updated_at)
+        self.assertEqual(candidate_rows, 4)
+
+    async def test_concurrent_misses_share_one_sweep_and_empty_results_are_cached(self) -> None:
+        slate_date = date(2026, 2, 11)
+        provider_count = len(self.service._provider_urls(slate_date))
+
+        results = await asyncio.gather(*(self.service.fetch_injuries(slate_date) for _ in range(5)))
+        await self.service.fetch_injuries(slate_date)
+
+        self.assertEqual(results, [[]] * 5)
+        self.assertEqual(len(self.service.requested_urls), provider_count)
+
+    async def test_odds_api_rows_are_counted_without_walking_the_payload(self) -> None:
+        payload = [
+            {
+                "title": "Boston Celtics",
+                "injuries": [{"player": "Jayson Tatum", "status": "Out", "description": "Ankle"}],
+            },
+            {"title": "Chicago Bulls", "injuries": []},
+        ]
+        self.service._collect_candidate_rows = None  # any walk would raise
+
+        injuries, candidate_rows = self.service._extract_injuries(payload=payload, source="odds-api", default_team=None)
+
+        self.assertEqual([(injury.player_name, injury.team) for injury in injuries], [("Jayson Tatum", "BOS")])
+        self.assertEqual(candidate_rows, 2)
+
+    async def test_status_inference_uses_first_whole_status_word(self) -> None:
+        self.assertEqual(self.service._infer_status_from_text("Doubtful, out last game"), "DOUBTFUL")
+        self.assertEqual(self.service._infer_status_from_text("Played without restriction"), "")
+        self.assertEqual(self.service._normalize_status("GAME-TIME DECISION"), "GTD")
+        self.assertEqual(self.service._normalize_status("DAY-TO-DAY"), "DAY-TO-DAY")
+
+
+if __name__ == "__main__":
+    unittest.main()
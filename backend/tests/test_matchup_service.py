@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 import unittest
 from unittest.mock import AsyncMock
 
-from app.models import Game, PlayerCardResponse, PlayerCardWindow, PositionGroup, Window
+from app.models import Game, GameLine, InjuryTag, PlayerCardResponse, PlayerCardWindow, PositionGroup, Window
 from app.services.cache import InMemoryCache
+from app.services.injury_service import build_injury_index
 from app.services.matchup_service import MatchupService
 
 
@@ -75,6 +77,19 @@ class FakeInjuryService:
     async def fetch_injuries(self, slate_date: date) -> list:
         return []
 
+    async def fetch_injuries_indexed(self, slate_date: date) -> tuple:
+        return [], ({}, {})
+
+
+class FakeLinesService:
+    def __init__(self, delay: float, lines: list[GameLine]) -> None:
+        self.delay = delay
+        self.lines = lines
+
+    async def fetch_game_lines(self, games: list[Game]) -> list[GameLine]:
+        await asyncio.sleep(self.delay)
+        return self.lines
+
 
 class FakeSnapshotStore:
     def __init__(self) -> None:
@@ -154,11 +169,58 @@ class MatchupServiceTests(unittest.IsolatedAsyncioTestCase):
         slate_date = date(2026, 2, 11)
         first = await service.get_matchups(slate_date=slate_date, window=Window.season)
         second = await service.get_matchups(slate_date=slate_date, window=Window.season)
+        await service.drain_background_writes()
 
         self.assertEqual(nba_service.build_calls, 1)
         self.assertEqual(snapshot_store.upsert_calls, 1)
         self.assertEqual(len(first.players), 1)
         self.assertEqual(len(second.players), 1)
+        self.assertEqual(first.players[0].stat_ranks, {"PTS": 5, "REB": 10, "AST": 7, "3PM": 4, "STL": 11, "BLK": 18})
+
+    async def test_cached_snapshot_is_not_mutated_by_derived_indexes(self) -> None:
+        nba_service = FakeNBADataService()
+        built: list[dict] = []
+        build_snapshot = nba_service.build_snapshot
+
+        def recording_build_snapshot(**kwargs) -> dict:
+            built.append(build_snapshot(**kwargs))
+            return built[-1]
+
+        nba_service.build_snapshot = recording_build_snapshot
+        service = MatchupService(
+            nba_service=nba_service,
+            injury_service=FakeInjuryService(),
+            cache=InMemoryCache(ttl_minutes=30),
+            snapshot_store=FakeSnapshotStore(),
+        )
+
+        slate_date = date(2026, 2, 11)
+        await service.get_matchups(slate_date=slate_date, window=Window.season)
+        last10 = await service.get_matchups(slate_date=slate_date, window=Window.last10)
+        await service.drain_background_writes()
+
+        self.assertEqual(len(built), 1)
+        self.assertEqual(set(built[0]), {"rotation_pool", "player_cards", "season", "last10"})
+        self.assertEqual(set(built[0]["season"]), {"ranks", "environment"})
+        self.assertEqual(set(built[0]["last10"]), {"ranks", "environment"})
+        self.assertEqual(last10.players[0].stat_ranks["PTS"], 8)
+
+    async def test_concurrent_get_matchups_compute_once(self) -> None:
+        snapshot_store = FakeSnapshotStore()
+        service = MatchupService(
+            nba_service=FakeNBADataService(),
+            injury_service=FakeInjuryService(),
+            cache=InMemoryCache(ttl_minutes=30),
+            snapshot_store=snapshot_store,
+        )
+
+        results = await asyncio.gather(
+            *(service.get_matchups(slate_date=date(2026, 2, 11), window=Window.season) for _ in range(5))
+        )
+        await service.drain_background_writes()
+
+        self.assertEqual([len(result.players) for result in results], [1] * 5)
+        self.assertEqual(snapshot_store.upsert_calls, 1)
 
     async def test_get_matchups_uses_snapshot_store_before_compute(self) -> None:
         slate_date = date(2026, 2, 11)
@@ -183,6 +245,65 @@ class MatchupServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(nba_service.build_calls, 0)
         self.assertEqual(len(loaded.players), 1)
 
+    async def test_get_matchups_reuses_overlay_while_injuries_are_unchanged(self) -> None:
+        injury_service = FakeInjuryService()
+        injuries = [InjuryTag(player_name="Test Player", team="BOS", status="OUT", source="espn")]
+        injury_service.fetch_injuries_indexed = AsyncMock(return_value=(injuries, build_injury_index(injuries)))
+        service = MatchupService(
+            nba_service=FakeNBADataService(),
+            injury_service=injury_service,
+            cache=InMemoryCache(ttl_minutes=30),
+            snapshot_store=FakeSnapshotStore(),
+        )
+
+        first = await service.get_matchups(slate_date=date(2026, 2, 11), window=Window.season)
+        second = await service.get_matchups(slate_date=date(2026, 2, 11), window=Window.season)
+        updated = [InjuryTag(player_name="Test Player", team="BOS", status="QUESTIONABLE", source="espn")]
+        injury_service.fetch_injuries_indexed.return_value = (updated, build_injury_index(updated))
+        third = await service.get_matchups(slate_date=date(2026, 2, 11), window=Window.season)
+        await service.drain_background_writes()
+
+        self.assertIs(second, first)
+        self.assertEqual(first.players[0].injury_status, "OUT")
+        self.assertEqual(third.players[0].injury_status, "QUESTIONABLE")
+
+    async def test_injury_overlay_matches_names_case_insensitively(self) -> None:
+        service = MatchupService(
+            nba_service=FakeNBADataService(),
+            injury_service=FakeInjuryService(),
+            cache=InMemoryCache(ttl_minutes=30),
+            snapshot_store=FakeSnapshotStore(),
+        )
+        base = await service._compute_matchups(slate_date=date(2026, 2, 11), window=Window.season)
+        injuries = [InjuryTag(player_name="test player", team="bos", status="OUT", source="espn")]
+
+        first = service._with_injury_overlay(base_response=base, injuries=injuries)
+        second = service._with_injury_overlay(base_response=base, injuries=[])
+
+        self.assertEqual(first.players[0].injury_status, "OUT")
+        self.assertIsNone(second.players[0].injury_status)
+        self.assertEqual(base.players[0]._name_key, "TEST PLAYER")
+        self.assertIs(second.players[0], base.players[0])
+        self.assertEqual(first.players[0]._name_key, "TEST PLAYER")
+
+    async def test_game_lines_fallback_runs_alongside_primary(self) -> None:
+        mcp_line = GameLine(game_id="001", away_team="CHI", home_team="BOS", game_total=221.5, source="mcp")
+        service = MatchupService(
+            nba_service=FakeNBADataService(),
+            injury_service=FakeInjuryService(),
+            cache=InMemoryCache(ttl_minutes=30),
+            snapshot_store=FakeSnapshotStore(),
+            odds_api_service=FakeLinesService(0.1, [GameLine(game_id="001", away_team="CHI", home_team="BOS")]),
+            sports_mcp_service=FakeLinesService(0.1, [mcp_line]),
+        )
+
+        started = asyncio.get_running_loop().time()
+        response = await service.get_game_lines(slate_date=date(2026, 2, 11))
+        elapsed = asyncio.get_running_loop().time() - started
+
+        self.assertEqual(response.lines, [mcp_line])
+        self.assertLess(elapsed, 0.18)
+
     async def test_refresh_without_recompute_does_not_trigger_get_matchups(self) -> None:
         nba_service = FakeNBADataService()
         cache = InMemoryCache(ttl_minutes=30)
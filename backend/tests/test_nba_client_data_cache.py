@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from datetime import date
+from pathlib import Path
+import tempfile
 import unittest
 
 import pandas as pd
@@ -77,6 +79,117 @@ class NBAClientDataCacheTests(unittest.TestCase):
         max_date = self.client._extract_max_game_date(logs)
         self.assertEqual(max_date, date(2026, 2, 10))
 
+    def test_raw_cache_round_trip(self) -> None:
+        frame = pd.DataFrame([{"PLAYER_ID": 1, "GAME_DATE": "2026-02-10", "MIN": 25.5}])
+        with tempfile.TemporaryDirectory() as tmp:
+            self.client._raw_data_dir = Path(tmp)
+            path = self.client._raw_cache_path("player_logs", "2025-26")
+
+            self.assertIsNone(self.client._read_cached_frame(path))
+            self.client._write_cached_frame(path, frame)
+            loaded = self.client._read_cached_frame(path)
+            projected = self.client._read_cached_frame(path, columns=["GAME_DATE"])
+
+        pd.testing.assert_frame_equal(loaded, frame.assign(GAME_DATE=pd.to_datetime(frame["GAME_DATE"])))
+        self.assertEqual(list(projected.columns), ["GAME_DATE"])
+
+    def test_slate_team_logs_are_read_from_disk_once(self) -> None:
+        frame = pd.DataFrame(
+            [{"GAME_ID": "001", "TEAM_ABBREVIATION": "BOS", "MATCHUP": "BOS vs. CHI", "GAME_DATE": "2026-02-10", "PTS": 110}]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            self.client._raw_data_dir = Path(tmp)
+            self.client._write_cached_frame(self.client._raw_cache_path("team_logs", "2025-26"), frame)
+
+            first = self.client._get_cached_team_logs_for_season("2025-26")
+            self.client._read_cached_frame = None  # any further disk read would raise
+            second = self.client._get_cached_team_logs_for_season("2025-26")
+
+        self.assertIs(first, second)
+        self.assertEqual(list(first.columns), ["GAME_ID", "TEAM_ABBREVIATION", "MATCHUP", "GAME_DATE"])
+
+    def test_stale_season_cache_fetches_only_recent_days(self) -> None:
+        cached = self.client._normalize_log_dtypes(
+            pd.DataFrame(
+                [
+                    {"PLAYER_ID": 1, "GAME_ID": "001", "GAME_DATE": "2026-02-09", "PTS": 10},
+                    {"PLAYER_ID": 1, "GAME_ID": "002", "GAME_DATE": "2026-02-10", "PTS": 12},
+                ]
+            )
+        )
+        recent = self.client._normalize_log_dtypes(
+            pd.DataFrame(
+                [
+                    {"PLAYER_ID": 1, "GAME_ID": "002", "GAME_DATE": "2026-02-10", "PTS": 14},
+                    {"PLAYER_ID": 1, "GAME_ID": "003", "GAME_DATE": "2026-02-11", "PTS": 20},
+                ]
+            )
+        )
+        requested: list[date | None] = []
+
+        def fake_fetch(season: str, date_from: date | None = None) -> pd.DataFrame:
+            requested.append(date_from)
+            return recent
+
+        self.client._season_player_logs_cache["2025-26"] = cached
+        self.client._fetch_player_logs_remote_full_season = fake_fetch
+        self.client._write_cached_frame = lambda path, frame: None
+
+        logs = self.client._get_season_player_logs(season="2025-26", as_of_date=date(2026, 2, 11))
+
+        self.assertEqual(requested, [date(2026, 2, 10)])
+        self.assertEqual(logs["GAME_ID"].tolist(), ["001", "002", "003"])
+        self.assertEqual(logs["PTS"].tolist(), [10, 14, 20])
+        self.assertIsInstance(logs["GAME_ID"].dtype, pd.CategoricalDtype)
+
+    def test_fetch_logs_returns_cached_frame_when_as_of_covers_season(self) -> None:
+        cached = self.client._normalize_log_dtypes(
+            pd.DataFrame(
+                [
+                    {"PLAYER_ID": 1, "GAME_ID": "001", "GAME_DATE": "2026-02-09"},
+                    {"PLAYER_ID": 1, "GAME_ID": "002", "GAME_DATE": "2026-02-10"},
+                ]
+            )
+        )
+        self.client._season_player_logs_cache["2025-26"] = cached
+
+        full = self.client.fetch_player_logs(as_of_date=date(2026, 2, 12), season="2025-26")
+        partial = self.client.fetch_player_logs(as_of_date=date(2026, 2, 9), season="2025-26")
+
+        self.assertIs(full, cached)
+        self.assertEqual(partial["GAME_ID"].tolist(), ["001"])
+
+    def test_build_roster_maps_from_cached_rosters(self) -> None:
+        client = NBADataService(enable_roster_fetch=True)
+        bos_id, chi_id = client.abbr_to_id["BOS"], client.abbr_to_id["CHI"]
+        client._roster_position_cache[("2025-26", bos_id)] = {1: [PositionGroup.guards]}
+        client._roster_player_ids_cache[("2025-26", bos_id)] = {1}
+        client._roster_position_cache[("2025-26", chi_id)] = {2: [PositionGroup.guards]}
+        client._roster_player_ids_cache[("2025-26", chi_id)] = {2, 3}
+
+        positions, player_ids, team_by_player = client._build_roster_maps("2025-26", {"BOS", "CHI"})
+
+        self.assertEqual(set(positions), {1, 2})
+        self.assertEqual(player_ids, {"BOS": {1}, "CHI": {2, 3}})
+        self.assertEqual(team_by_player, {1: "BOS", 2: "CHI", 3: "CHI"})
+
+    def test_normalized_logs_filter_by_as_of(self) -> None:
+        frame = self.client._normalize_log_dtypes(
+            pd.DataFrame(
+                [
+                    {"PLAYER_ID": "1", "GAME_DATE": "2026-02-10T00:00:00"},
+                    {"PLAYER_ID": "2", "GAME_DATE": "2026-02-11T00:00:00"},
+                    {"PLAYER_ID": "3", "GAME_DATE": "not a date"},
+                ]
+            )
+        )
+
+        filtered = self.client._filter_logs_by_as_of(frame, as_of_date=date(2026, 2, 10))
+
+        self.assertEqual(str(frame["PLAYER_ID"].dtype), "Int64")
+        self.assertEqual(filtered["PLAYER_ID"].tolist(), [1])
+        self.assertEqual(self.client._extract_max_game_date(frame), date(2026, 2, 11))
+
     def test_build_games_from_team_logs(self) -> None:
         team_logs = pd.DataFrame(
             [
@@ -225,6 +338,17 @@ class NBAClientDataCacheTests(unittest.TestCase):
         self.assertEqual(len(cards), 1)
         self.assertEqual(cards[0].player_id, 1)
 
+    def test_stats_budget_halves_on_rate_limit_and_recovers(self) -> None:
+        self.client._stats_rpm_limit = self.client._stats_rpm = 8
+
+        self.client._record_stats_outcome(RuntimeError("429 Too Many Requests"))
+        self.client._record_stats_outcome(RuntimeError("Read timed out"))
+        throttled = self.client._stats_rpm
+        self.client._record_stats_outcome(None)
+
+        self.assertEqual(throttled, 4)
+        self.assertEqual(self.client._stats_rpm, 5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,38 +2,73 @@ from __future__ import annotations
 
 import unittest
 
+import pandas as pd
+
 from app.models import PositionGroup
 from app.services.nba_client import NBADataService
 
 
+def _infer(
+    height_inches: object | None, height: object | None, ast: object | None, reb: object | None
+) -> tuple[PositionGroup, ...]:
+    frame = pd.DataFrame([{"HEIGHT_INCHES": height_inches, "HEIGHT": height, "AST": ast, "REB": reb}])
+    return NBADataService._infer_position_groups_bulk(frame, "HEIGHT_INCHES", "HEIGHT", "AST", "REB")[0]
+
+
 class NBAClientPositionInferenceTests(unittest.TestCase):
     def test_infers_guard_from_height_inches(self) -> None:
-        groups = NBADataService._infer_position_groups(76, None, None, None)
-        self.assertEqual(groups, [PositionGroup.guards])
+        groups = _infer(76, None, None, None)
+        self.assertEqual(groups, (PositionGroup.guards,))
 
     def test_infers_forward_from_height_inches(self) -> None:
-        groups = NBADataService._infer_position_groups(80, None, None, None)
-        self.assertEqual(groups, [PositionGroup.forwards])
+        groups = _infer(80, None, None, None)
+        self.assertEqual(groups, (PositionGroup.forwards,))
 
     def test_infers_center_from_height_inches(self) -> None:
-        groups = NBADataService._infer_position_groups(83, None, None, None)
-        self.assertEqual(groups, [PositionGroup.centers])
+        groups = _infer(83, None, None, None)
+        self.assertEqual(groups, (PositionGroup.centers,))
 
     def test_infers_from_height_text(self) -> None:
-        groups = NBADataService._infer_position_groups(None, "6-11", None, None)
-        self.assertEqual(groups, [PositionGroup.centers])
+        groups = _infer(None, "6-11", None, None)
+        self.assertEqual(groups, (PositionGroup.centers,))
 
     def test_falls_back_to_ast_profile(self) -> None:
-        groups = NBADataService._infer_position_groups(None, None, 7.1, 3.2)
-        self.assertEqual(groups, [PositionGroup.guards])
+        groups = _infer(None, None, 7.1, 3.2)
+        self.assertEqual(groups, (PositionGroup.guards,))
 
     def test_falls_back_to_reb_profile(self) -> None:
-        groups = NBADataService._infer_position_groups(None, None, 1.8, 9.4)
-        self.assertEqual(groups, [PositionGroup.centers])
+        groups = _infer(None, None, 1.8, 9.4)
+        self.assertEqual(groups, (PositionGroup.centers,))
 
     def test_unknown_profile_returns_empty(self) -> None:
-        groups = NBADataService._infer_position_groups(None, None, None, None)
-        self.assertEqual(groups, [])
+        groups = _infer(None, None, None, None)
+        self.assertEqual(groups, ())
+
+    def test_bulk_inference_over_frame_columns(self) -> None:
+        frame = pd.DataFrame(
+            [
+                {"HEIGHT_INCHES": 76, "HEIGHT": None, "AST": "", "REB": ""},
+                {"HEIGHT_INCHES": None, "HEIGHT": "6-11", "AST": "", "REB": ""},
+                {"HEIGHT_INCHES": None, "HEIGHT": " 6-7 ", "AST": "", "REB": ""},
+                {"HEIGHT_INCHES": None, "HEIGHT": "bad", "AST": 7.1, "REB": 3.2},
+                {"HEIGHT_INCHES": None, "HEIGHT": None, "AST": 1.8, "REB": 9.4},
+                {"HEIGHT_INCHES": None, "HEIGHT": None, "AST": None, "REB": None},
+            ]
+        )
+
+        groups = NBADataService._infer_position_groups_bulk(frame, "HEIGHT_INCHES", "HEIGHT", "AST", "REB")
+
+        self.assertEqual(
+            groups,
+            [
+                (PositionGroup.guards,),
+                (PositionGroup.centers,),
+                (PositionGroup.forwards,),
+                (PositionGroup.guards,),
+                (PositionGroup.centers,),
+                (),
+            ],
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import unittest
+
+from app.models import PositionGroup
+from app.services.scoring import build_rank_tables
+
+
+class BuildRankTablesTests(unittest.TestCase):
+    def test_ranks_descending_with_ties_in_team_order(self) -> None:
+        stats = {
+            "BOS": {PositionGroup.guards: {"PTS": 20.0}},
+            "LAL": {PositionGroup.guards: {"PTS": 25.0}},
+            "NYK": {PositionGroup.guards: {"PTS": 20.0}},
+        }
+
+        ranks = build_rank_tables(team_group_stats=stats, teams=["BOS", "LAL", "NYK", "MIA"])
+
+        self.assertEqual(
+            [ranks[team][PositionGroup.guards]["PTS"] for team in ["LAL", "BOS", "NYK", "MIA"]],
+            [1, 2, 3, 4],
+        )
+        self.assertEqual(ranks["MIA"][PositionGroup.centers]["PTS"], 4)
+        self.assertEqual(build_rank_tables(team_group_stats=stats, teams=[]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()